@@ -5,11 +5,14 @@
  * Creates a new feature branch and sets up the spec directory structure.
  */
 
-import { execSync } from 'child_process';
+import { exec, execSync } from 'child_process';
 import { existsSync, mkdirSync, copyFileSync, writeFileSync, readdirSync, statSync } from 'fs';
 import { join, dirname } from 'path';
+import { promisify } from 'util';
 import { getRepoRoot, hasGit } from '../lib/common.js';
 
+const execAsync = promisify(exec);
+
 /**
  * Options for create-new-feature command
  */
@@ -40,6 +43,12 @@ const STOP_WORDS = new Set([
   'want', 'need', 'add', 'get', 'set'
 ]);
 
+/**
+ * Feature number of each `git branch -a` line, e.g. "* 004-x" or
+ * "  remotes/origin/004-x"
+ */
+const BRANCH_LIST_FEATURE_PATTERN = /^[* ]*(?:remotes\/[^/\n]+\/)?(\d{3})-/gm;
+
 /**
  * Clean and format a branch name.
  */
@@ -116,90 +125,48 @@ function getHighestFromSpecs(specsDir: string): number {
 }
 
 /**
- * Get highest number from git branches.
+ * Highest feature number in `git branch -a` output, or 0.
+ * One multiline pass over the listing; leading markers and remote
+ * prefixes are skipped by the pattern instead of per-line replaces.
  */
-function getHighestFromBranches(): number {
+export function highestFeatureFromBranchList(output: string): number {
   let highest = 0;
-
-  try {
-    const branches = execSync('git branch -a', { encoding: 'utf-8', stdio: ['pipe', 'pipe', 'ignore'] });
-
-    for (const line of branches.split('\n')) {
-      // Clean branch name: remove leading markers and remote prefixes
-      const cleanBranch = line.replace(/^[* ]+/, '').replace(/^remotes\/[^/]+\//, '').trim();
-
-      // Extract feature number if branch matches pattern ###-*
-      const match = cleanBranch.match(/^(\d{3})-/);
-      if (match && match[1]) {
-        const num = parseInt(match[1], 10);
-        if (num > highest) {
-          highest = num;
-        }
-      }
+  for (const match of output.matchAll(BRANCH_LIST_FEATURE_PATTERN)) {
+    const num = parseInt(match[1]!, 10);
+    if (num > highest) {
+      highest = num;
     }
-  } catch {
-    // Ignore errors
   }
-
   return highest;
 }
 
 /**
- * Check existing branches (local and remote) and return next available number.
+ * Get highest number from git branches.
  */
-function checkExistingBranches(shortName: string, specsDir: string): number {
-  let maxNum = 0;
-
-  try {
-    // Fetch all remotes to get latest branch info
-    execSync('git fetch --all --prune', { stdio: 'ignore' });
-  } catch {
-    // Ignore fetch errors (e.g., no remotes)
-  }
-
-  // Check remote branches
+function getHighestFromBranches(): number {
   try {
-    const remoteBranches = execSync('git ls-remote --heads origin', { encoding: 'utf-8', stdio: ['pipe', 'pipe', 'ignore'] });
-    const pattern = new RegExp(`refs/heads/(\\d+)-${shortName}$`, 'gm');
-    let match;
-    while ((match = pattern.exec(remoteBranches)) !== null) {
-      if (match[1]) {
-        const num = parseInt(match[1], 10);
-        if (num > maxNum) maxNum = num;
-      }
-    }
+    const branches = execSync('git branch -a', { encoding: 'utf-8', stdio: ['pipe', 'pipe', 'ignore'] });
+    return highestFeatureFromBranchList(branches);
   } catch {
     // Ignore errors
+    return 0;
   }
+}
 
-  // Check local branches
-  try {
-    const localBranches = execSync('git branch', { encoding: 'utf-8', stdio: ['pipe', 'pipe', 'ignore'] });
-    const pattern = new RegExp(`^[* ]*(\\d+)-${shortName}$`, 'gm');
-    let match;
-    while ((match = pattern.exec(localBranches)) !== null) {
-      if (match[1]) {
-        const num = parseInt(match[1], 10);
-        if (num > maxNum) maxNum = num;
-      }
-    }
-  } catch {
-    // Ignore errors
-  }
+/**
+ * Highest number of a specs/ directory named NNN-shortName, or 0.
+ */
+function getHighestSpecForName(shortName: string, specsDir: string): number {
+  let maxNum = 0;
 
-  // Check specs directory
   if (existsSync(specsDir)) {
     try {
-      const entries = readdirSync(specsDir);
       const pattern = new RegExp(`^(\\d+)-${shortName}$`);
-      for (const entry of entries) {
-        const fullPath = join(specsDir, entry);
-        if (statSync(fullPath).isDirectory()) {
-          const match = entry.match(pattern);
-          if (match && match[1]) {
-            const num = parseInt(match[1], 10);
-            if (num > maxNum) maxNum = num;
-          }
+      for (const entry of readdirSync(specsDir)) {
+        const match = entry.match(pattern);
+        if (match && match[1] && statSync(join(specsDir, entry)).isDirectory()) {
+          const num = parseInt(match[1], 10);
+          if (num > maxNum) maxNum = num;
         }
       }
     } catch {
@@ -207,6 +174,52 @@ function checkExistingBranches(shortName: string, specsDir: string): number {
     }
   }
 
+  return maxNum;
+}
+
+/**
+ * Highest number among `git for-each-ref --format="%(refname:short)"` lines
+ * named NNN-shortName or origin/NNN-shortName, or 0.
+ */
+export function highestFeatureForName(refs: string, shortName: string): number {
+  let maxNum = 0;
+  const pattern = new RegExp(`^(?:origin/)?(\\d+)-${shortName}$`, 'gm');
+  for (const match of refs.matchAll(pattern)) {
+    const num = parseInt(match[1]!, 10);
+    if (num > maxNum) maxNum = num;
+  }
+  return maxNum;
+}
+
+/**
+ * Check existing branches (local and remote) and return next available number.
+ */
+export async function checkExistingBranches(
+  shortName: string,
+  specsDir: string,
+  repoRoot: string
+): Promise<number> {
+  // Fetch all remotes to get latest branch info. The fetch is a network
+  // round trip, so scan specs/ while it is in flight. Its progress output is
+  // unused, but lift the buffer cap so many remotes can't fail the fetch.
+  const fetched = execAsync('git fetch --all --prune', { cwd: repoRoot, maxBuffer: Infinity }).catch(() => {
+    // Ignore fetch errors (e.g., unreachable remote); the refs below may be stale
+  });
+  let maxNum = getHighestSpecForName(shortName, specsDir);
+  await fetched;
+
+  // Check local and origin branches in one call; the fetch above keeps
+  // refs/remotes/origin current, so this matches what ls-remote would report
+  try {
+    const refs = execSync(
+      'git for-each-ref --format="%(refname:short)" refs/heads refs/remotes/origin',
+      { cwd: repoRoot, encoding: 'utf-8', stdio: ['pipe', 'pipe', 'ignore'] }
+    );
+    maxNum = Math.max(maxNum, highestFeatureForName(refs, shortName));
+  } catch {
+    // Ignore errors
+  }
+
   return maxNum + 1;
 }
 
@@ -278,7 +291,7 @@ export async function createNewFeature(
       process.exit(1);
     }
   } else if (hasGitRepo) {
-    branchNumber = checkExistingBranches(branchSuffix, specsDir);
+    branchNumber = await checkExistingBranches(branchSuffix, specsDir, repoRoot);
   } else {
     const highest = getHighestFromSpecs(specsDir);
     branchNumber = highest + 1;
@@ -10,7 +10,7 @@ import { showBanner } from '../lib/ui/banner.js';
 import { StepTracker } from '../lib/ui/tracker.js';
 import { panel } from '../lib/ui/console.js';
 import { selectWithArrows, getAIChoices, DEFAULT_AI_KEY } from '../lib/ui/select.js';
-import { AGENT_CONFIG } from '../lib/config.js';
+import { AGENT_CONFIG, AGENT_KEYS } from '../lib/config.js';
 import { checkTool } from '../lib/tools/detect.js';
 import { initGitRepo, isGitRepo } from '../lib/tools/git.js';
 import { generateTemplates } from '../lib/template/generator.js';
@@ -29,7 +29,7 @@ Consider adding them to .gitignore if you don't want to share them.
 /**
  * Get next steps content based on configuration.
  */
-function getNextSteps(projectName: string, selectedAi: string, inCurrentDir: boolean): string {
+export function getNextSteps(projectName: string, selectedAi: string, inCurrentDir: boolean): string {
   const cdStep = inCurrentDir ? '' : `  ${chalk.cyan('cd')} ${projectName}\n`;
   
   return `${cdStep}  ${chalk.cyan('code')} .
@@ -71,6 +71,34 @@ Add this to your shell profile (.bashrc, .zshrc) to persist it.
 `;
 }
 
+/**
+ * Where init will create the project.
+ */
+export interface ProjectTarget {
+  projectName: string;
+  projectPath: string;
+  inCurrentDir: boolean;
+}
+
+/**
+ * Resolve the project name and path from the init arguments.
+ * "." and --here both target the current directory, named after its basename.
+ * @returns The target, or null when neither a name nor --here was given
+ */
+export function resolveProjectTarget(
+  projectName: string | undefined,
+  here = false
+): ProjectTarget | null {
+  if (here || projectName === '.') {
+    const projectPath = process.cwd();
+    return { projectName: basename(projectPath), projectPath, inCurrentDir: true };
+  }
+  if (projectName) {
+    return { projectName, projectPath: resolve(projectName), inCurrentDir: false };
+  }
+  return null;
+}
+
 /**
  * Initialize a new Specify project from the latest template.
  */
@@ -80,28 +108,16 @@ export async function init(
 ): Promise<void> {
   showBanner();
 
-  // Handle "." as --here flag
-  if (projectName === '.') {
-    options.here = true;
-    projectName = undefined;
-  }
-
   // Determine project path
-  let projectPath: string;
-  const inCurrentDir = options.here ?? false;
-  
-  if (inCurrentDir) {
-    projectPath = process.cwd();
-    projectName = basename(projectPath);
-  } else if (projectName) {
-    projectPath = resolve(projectName);
-  } else {
+  const target = resolveProjectTarget(projectName, options.here);
+  if (!target) {
     console.log(chalk.red('Error:') + ' Please provide a project name or use --here');
     console.log('');
     console.log('Usage: speckit init <project-name>');
     console.log('       speckit init --here');
     process.exit(ExitCode.INVALID_ARGUMENT);
   }
+  const { projectPath, inCurrentDir } = target;
 
   // Validate project directory
   if (!inCurrentDir && existsSync(projectPath)) {
@@ -138,16 +154,16 @@ export async function init(
         throw error;
       }
     } else {
-      // Non-interactive: default to copilot
-      selectedAi = 'copilot';
-      console.log(chalk.cyan('Note:') + ' Defaulting to copilot. Use --ai <name> to specify an AI assistant.');
+      // Non-interactive: fall back to the same default the selector highlights
+      selectedAi = DEFAULT_AI_KEY;
+      console.log(chalk.cyan('Note:') + ` Defaulting to ${DEFAULT_AI_KEY}. Use --ai <name> to specify an AI assistant.`);
     }
   }
 
   // Validate AI assistant
-  if (!AGENT_CONFIG[selectedAi]) {
+  if (!AGENT_KEYS.has(selectedAi)) {
     console.log(chalk.red('Error:') + ` Unknown AI assistant '${selectedAi}'.`);
-    console.log('Valid options: ' + Object.keys(AGENT_CONFIG).join(', '));
+    console.log('Valid options: ' + [...AGENT_KEYS].join(', '));
     process.exit(ExitCode.INVALID_ARGUMENT);
   }
 
@@ -166,7 +182,7 @@ export async function init(
   }
 
   // Initialize step tracker
-  const tracker = new StepTracker(`Initialize ${projectName}`);
+  const tracker = new StepTracker(`Initialize ${target.projectName}`);
 
   tracker.add('generate', 'Generate templates');
   if (!options.noGit) {
@@ -175,7 +191,7 @@ export async function init(
 
   console.log();
   console.log(chalk.cyan('Project Configuration:'));
-  console.log(`  Name: ${chalk.green(projectName)}`);
+  console.log(`  Name: ${chalk.green(target.projectName)}`);
   console.log(`  Path: ${chalk.green(projectPath)}`);
   console.log(`  AI Assistant: ${chalk.green(agentConfig.name)}`);
   console.log();
@@ -227,7 +243,7 @@ export async function init(
   }
 
   // Show next steps panel
-  panel(getNextSteps(projectName!, selectedAi, inCurrentDir), 'Next Steps');
+  panel(getNextSteps(target.projectName, selectedAi, inCurrentDir), 'Next Steps');
   console.log();
 
   // Success message
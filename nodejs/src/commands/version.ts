@@ -8,45 +8,46 @@ import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
 import chalk from 'chalk';
 import { showBanner } from '../lib/ui/banner.js';
-import { getGitHubToken, getAuthHeaders } from '../lib/github/token.js';
+import { getGitHubToken } from '../lib/github/token.js';
+import { fetchLatestRelease } from '../lib/github/client.js';
+import { getDefaultCacheDir } from '../lib/github/release-cache.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
 /**
- * Get the CLI version from package.json
+ * CLI version read from package.json, cached after the first lookup
  */
-function getCliVersion(): string {
-  try {
-    const pkgPath = join(__dirname, '..', '..', 'package.json');
-    const pkg = JSON.parse(readFileSync(pkgPath, 'utf-8')) as { version: string };
-    return pkg.version;
-  } catch {
-    return '0.0.1';
+let cachedCliVersion: string | undefined;
+
+/**
+ * Get the CLI version from package.json.
+ * The file is read at most once per process.
+ */
+export function getCliVersion(): string {
+  if (cachedCliVersion === undefined) {
+    try {
+      const pkgPath = join(__dirname, '..', '..', 'package.json');
+      const pkg = JSON.parse(readFileSync(pkgPath, 'utf-8')) as { version: string };
+      cachedCliVersion = pkg.version;
+    } catch {
+      cachedCliVersion = '0.0.1';
+    }
   }
+  return cachedCliVersion;
 }
 
 /**
- * Fetch the latest template version from GitHub releases API
+ * Fetch the latest template version from GitHub releases API.
+ * Goes through the release ETag cache, so repeat runs get a 304.
  */
-async function getLatestTemplateVersion(githubToken?: string): Promise<string | null> {
-  const url = 'https://api.github.com/repos/github/spec-kit/releases/latest';
-
+export async function getLatestTemplateVersion(
+  githubToken?: string,
+  cacheDir: string = getDefaultCacheDir()
+): Promise<string | null> {
   try {
-    const headers: Record<string, string> = {
-      Accept: 'application/vnd.github+json',
-      'User-Agent': 'speckit-cli',
-      ...getAuthHeaders(githubToken),
-    };
-
-    const response = await fetch(url, { headers });
-
-    if (!response.ok) {
-      return null;
-    }
-
-    const data = (await response.json()) as { tag_name: string };
-    return data.tag_name || null;
+    const release = await fetchLatestRelease({ token: githubToken, cacheDir });
+    return release.tag_name || null;
   } catch {
     return null;
   }
@@ -6,6 +6,7 @@
 // Export configuration
 export {
   AGENT_CONFIG,
+  AGENT_KEYS,
   BANNER,
   TAGLINE,
   CLAUDE_LOCAL_PATH,
@@ -20,7 +21,7 @@ export { StepTracker } from './lib/ui/tracker.js';
 export { showBanner, getBannerText, getTagline } from './lib/ui/banner.js';
 
 // Export template utilities
-export { deepMerge, mergeJsonFiles } from './lib/template/merge.js';
+export { deepMerge, mergeJsonFiles, writeJsonFile } from './lib/template/merge.js';
 
 // Export tool utilities
 export { checkTool, checkToolForTracker } from './lib/tools/detect.js';
@@ -40,3 +41,6 @@ export type { InitOptions, TemplateMetadata, TemplateDownloadResult } from './ty
 export { init } from './commands/init.js';
 export { check } from './commands/check.js';
 export { version } from './commands/version.js';
+
+// Export CLI program factory
+export { createProgram } from './program.js';
@@ -76,41 +76,66 @@ export function getCurrentBranch(): string {
     return result.trim();
   } catch {
     // For non-git repos, try to find the latest feature directory
-    const repoRoot = getRepoRoot();
-    const specsDir = join(repoRoot, 'specs');
-
-    if (existsSync(specsDir)) {
-      let latestFeature = '';
-      let highest = 0;
-
-      try {
-        const entries = readdirSync(specsDir);
-        for (const entry of entries) {
-          const fullPath = join(specsDir, entry);
-          if (statSync(fullPath).isDirectory()) {
-            const match = entry.match(/^(\d{3})-/);
-            if (match && match[1]) {
-              const number = parseInt(match[1], 10);
-              if (number > highest) {
-                highest = number;
-                latestFeature = entry;
-              }
-            }
-          }
-        }
-      } catch {
-        // Ignore errors reading directory
-      }
-
-      if (latestFeature) {
-        return latestFeature;
-      }
+    const latestFeature = findLatestFeature(join(getRepoRoot(), 'specs'));
+    if (latestFeature) {
+      return latestFeature;
     }
 
     return 'main'; // Final fallback
   }
 }
 
+/**
+ * Parse the NNN feature number from a "NNN-name" branch or spec directory.
+ * This is the single check for the feature prefix; it works on char codes
+ * so names that are not features (main, develop, ...) are rejected cheaply.
+ * Returns -1 when the name has no three-digit prefix followed by "-".
+ */
+function featureNumber(name: string): number {
+  if (name.length < 4 || name.charCodeAt(3) !== 45 /* - */) {
+    return -1;
+  }
+  let number = 0;
+  for (let i = 0; i < 3; i++) {
+    const digit = name.charCodeAt(i) - 48; /* 0 */
+    if (digit < 0 || digit > 9) {
+      return -1;
+    }
+    number = number * 10 + digit;
+  }
+  return number;
+}
+
+/**
+ * Find the highest-numbered feature directory in specs/.
+ * Directory entries come from a single readdir with file types, so no
+ * per-entry stat is needed except for symlinks.
+ * @returns The directory name, or an empty string if none exists
+ */
+export function findLatestFeature(specsDir: string): string {
+  let latestFeature = '';
+  let highest = 0;
+
+  try {
+    for (const entry of readdirSync(specsDir, { withFileTypes: true })) {
+      const number = featureNumber(entry.name);
+      if (number <= highest) {
+        continue;
+      }
+      const isDir = entry.isDirectory() ||
+        (entry.isSymbolicLink() && statSync(join(specsDir, entry.name)).isDirectory());
+      if (isDir) {
+        highest = number;
+        latestFeature = entry.name;
+      }
+    }
+  } catch {
+    // Missing specs/ or an unreadable entry
+  }
+
+  return latestFeature;
+}
+
 /**
  * Check if we're on a valid feature branch.
  * @param branch - Branch name to check
@@ -130,7 +155,7 @@ export function checkFeatureBranch(
   }
 
   // Feature branches should match pattern: 001-feature-name
-  if (!/^\d{3}-/.test(branch)) {
+  if (featureNumber(branch) < 0) {
     return {
       isValid: false,
       error: `ERROR: Not on a feature branch. Current branch: ${branch}\nFeature branches should be named like: 001-feature-name`,
@@ -148,13 +173,12 @@ export function findFeatureDirByPrefix(repoRoot: string, branchName: string): st
   const specsDir = join(repoRoot, 'specs');
 
   // Extract numeric prefix from branch (e.g., "004" from "004-whatever")
-  const prefixMatch = branchName.match(/^(\d{3})-/);
-  if (!prefixMatch) {
+  if (featureNumber(branchName) < 0) {
     // If branch doesn't have numeric prefix, fall back to exact match
     return join(specsDir, branchName);
   }
 
-  const prefix = prefixMatch[1];
+  const prefix = branchName.slice(0, 3);
   const matches: string[] = [];
 
   // Search for directories in specs/ that start with this prefix
@@ -20,11 +20,24 @@ export interface AgentConfig {
   requiresCli: boolean;
 }
 
+/**
+ * Freeze the agent table and each of its entries
+ */
+function freezeAgentConfig(
+  config: Record<string, AgentConfig>
+): Readonly<Record<string, Readonly<AgentConfig>>> {
+  for (const entry of Object.values(config)) {
+    Object.freeze(entry);
+  }
+  return Object.freeze(config);
+}
+
 /**
  * Agent configuration with name, folder, install URL, and CLI tool requirement.
  * The key is the actual CLI tool name (what users type in terminal).
+ * Frozen: the table is shared process-wide and never changes at runtime.
  */
-export const AGENT_CONFIG: Record<string, AgentConfig> = {
+export const AGENT_CONFIG = freezeAgentConfig({
   copilot: {
     name: 'GitHub Copilot',
     folder: '.github/',
@@ -115,7 +128,14 @@ export const AGENT_CONFIG: Record<string, AgentConfig> = {
     installUrl: 'https://github.com/ovh/shai',
     requiresCli: true,
   },
-};
+});
+
+/**
+ * Set of valid agent keys for membership checks.
+ * Unlike indexing AGENT_CONFIG, this never matches inherited names such as
+ * 'toString' or 'constructor'.
+ */
+export const AGENT_KEYS: ReadonlySet<string> = new Set(Object.keys(AGENT_CONFIG));
 
 /**
  * Special path for Claude CLI after `claude migrate-installer`
@@ -6,6 +6,13 @@
 import { getAuthHeaders } from './token.js';
 import { parseRateLimitHeaders, formatRateLimitError } from './rate-limit.js';
 import { RateLimitError, NetworkError } from '../errors.js';
+import { readReleaseCache, writeReleaseCache } from './release-cache.js';
+
+/**
+ * Repository that publishes the spec-kit templates
+ */
+export const REPO_OWNER = 'github';
+export const REPO_NAME = 'spec-kit';
 
 /**
  * GitHub release asset information
@@ -34,6 +41,8 @@ export interface GitHubRelease {
 export interface FetchReleaseOptions {
   token?: string;
   skipTls?: boolean;
+  /** Directory for the ETag cache; conditional requests are only made when set */
+  cacheDir?: string;
 }
 
 /**
@@ -42,34 +51,59 @@ export interface FetchReleaseOptions {
 const GITHUB_API_URL = 'https://api.github.com';
 
 /**
- * Repository owner and name for spec-kit
+ * Headers sent with every client request; auth headers are added per call
  */
-const REPO_OWNER = 'github';
-const REPO_NAME = 'spec-kit';
+const CLIENT_HEADERS: Readonly<Record<string, string>> = Object.freeze({
+  Accept: 'application/vnd.github.v3+json',
+  'User-Agent': 'speckit-cli/nodejs',
+});
+
+/**
+ * Send one releases API request, wrapping connection failures in NetworkError.
+ */
+async function requestRelease(url: string, headers: Record<string, string>): Promise<Response> {
+  try {
+    return await fetch(url, { headers });
+  } catch (error) {
+    throw new NetworkError(
+      `Failed to connect to GitHub API: ${error instanceof Error ? error.message : String(error)}`,
+      undefined,
+      url
+    );
+  }
+}
 
 /**
  * Fetch the latest release from the spec-kit repository.
+ * This is the only releases/latest request in the CLI; pass cacheDir to
+ * replay the stored ETag and reuse the cached body on 304.
  */
 export async function fetchLatestRelease(
   options?: FetchReleaseOptions
 ): Promise<GitHubRelease> {
   const url = `${GITHUB_API_URL}/repos/${REPO_OWNER}/${REPO_NAME}/releases/latest`;
   
+  const cacheDir = options?.cacheDir;
+  const cached = cacheDir ? readReleaseCache<GitHubRelease>(cacheDir) : undefined;
+
   const headers: Record<string, string> = {
-    Accept: 'application/vnd.github.v3+json',
-    'User-Agent': 'speckit-cli/nodejs',
+    ...CLIENT_HEADERS,
     ...getAuthHeaders(options?.token),
   };
+  if (cached) {
+    headers['If-None-Match'] = cached.etag;
+  }
 
-  let response: Response;
-  try {
-    response = await fetch(url, { headers });
-  } catch (error) {
-    throw new NetworkError(
-      `Failed to connect to GitHub API: ${error instanceof Error ? error.message : String(error)}`,
-      undefined,
-      url
-    );
+  let response = await requestRelease(url, headers);
+
+  if (response.status === 304) {
+    // Unchanged since the cached copy; 304s don't count against the rate limit
+    if (cached) {
+      return cached.body;
+    }
+    // Nothing cached to reuse, so ask once more for the full body
+    delete headers['If-None-Match'];
+    response = await requestRelease(url, headers);
   }
 
   if (!response.ok) {
@@ -101,6 +135,11 @@ export async function fetchLatestRelease(
   }
 
   const data = await response.json() as GitHubRelease;
+
+  const etag = response.headers.get('ETag');
+  if (cacheDir && etag) {
+    writeReleaseCache(cacheDir, etag, data);
+  }
   return data;
 }
 
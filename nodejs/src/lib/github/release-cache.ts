@@ -0,0 +1,62 @@
+/**
+ * ETag cache for the GitHub releases endpoint.
+ * A 304 Not Modified reply does not count against the primary rate limit,
+ * so replaying a stored ETag lets repeated runs reuse the last release body.
+ */
+
+import { readFileSync, writeFileSync, mkdirSync } from 'node:fs';
+import { join } from 'node:path';
+import envPaths from 'env-paths';
+
+/**
+ * File name of the cached latest-release response
+ */
+export const RELEASE_CACHE_FILE = 'releases-latest.json';
+
+/**
+ * Cached release response
+ */
+export interface CachedRelease<T = unknown> {
+  etag: string;
+  body: T;
+  fetchedAt: string;
+}
+
+/**
+ * Default per-user cache directory for speckit
+ */
+export function getDefaultCacheDir(): string {
+  return envPaths('speckit', { suffix: '' }).cache;
+}
+
+/**
+ * Read the cached release from cacheDir.
+ * Returns undefined when there is no cache or it cannot be parsed.
+ */
+export function readReleaseCache<T>(cacheDir: string): CachedRelease<T> | undefined {
+  try {
+    const cached = JSON.parse(
+      readFileSync(join(cacheDir, RELEASE_CACHE_FILE), 'utf-8')
+    ) as Partial<CachedRelease<T>>;
+    if (typeof cached.etag === 'string' && cached.body !== undefined) {
+      return cached as CachedRelease<T>;
+    }
+  } catch {
+    // Missing or corrupt cache, fetch fresh
+  }
+  return undefined;
+}
+
+/**
+ * Store a release body and its ETag in cacheDir.
+ * Failures are ignored; the cache is only an optimization.
+ */
+export function writeReleaseCache<T>(cacheDir: string, etag: string, body: T): void {
+  const entry: CachedRelease<T> = { etag, body, fetchedAt: new Date().toISOString() };
+  try {
+    mkdirSync(cacheDir, { recursive: true });
+    writeFileSync(join(cacheDir, RELEASE_CACHE_FILE), JSON.stringify(entry));
+  } catch {
+    // Read-only home or similar, skip caching
+  }
+}
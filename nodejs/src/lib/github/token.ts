@@ -3,6 +3,11 @@
  * Ported from Python specify_cli/__init__.py
  */
 
+/**
+ * Carriage returns and newlines stripped from tokens
+ */
+const LINE_BREAKS = /[\r\n]/g;
+
 /**
  * Return sanitized GitHub token (CLI arg takes precedence) or undefined.
  * Checks in order: CLI token > GH_TOKEN > GITHUB_TOKEN
@@ -11,22 +16,49 @@
  * @returns Sanitized token string or undefined if no valid token found
  */
 export function getGitHubToken(cliToken?: string): string | undefined {
-  const token = (
-    cliToken || process.env.GH_TOKEN || process.env.GITHUB_TOKEN || ''
-  )
-    .trim()
-    .replace(/[\r\n]/g, '');
+  // First non-empty source wins; later env vars are not read once one is found
+  const raw = cliToken || process.env.GH_TOKEN || process.env.GITHUB_TOKEN;
+  if (!raw) {
+    return undefined;
+  }
+
+  let token = raw.trim();
+  // Embedded line breaks are rare, so only run the replace when one is present
+  if (token.includes('\n') || token.includes('\r')) {
+    token = token.replace(LINE_BREAKS, '');
+  }
 
   return token || undefined;
 }
 
+/**
+ * Shared, frozen header objects so repeated API calls reuse one allocation
+ * per token. Callers spread these into their request headers.
+ */
+const NO_AUTH_HEADERS: Readonly<Record<string, string>> = Object.freeze({});
+const AUTH_HEADER_CACHE_SIZE = 4;
+const authHeaderCache = new Map<string, Readonly<Record<string, string>>>();
+
 /**
  * Return Authorization header dict only when a non-empty token exists.
  *
  * @param cliToken - Optional token provided via CLI argument
- * @returns Headers object with Authorization if token exists, empty object otherwise
+ * @returns Frozen headers object with Authorization if token exists, empty object otherwise
  */
-export function getAuthHeaders(cliToken?: string): Record<string, string> {
+export function getAuthHeaders(cliToken?: string): Readonly<Record<string, string>> {
   const token = getGitHubToken(cliToken);
-  return token ? { Authorization: `Bearer ${token}` } : {};
+  if (!token) {
+    return NO_AUTH_HEADERS;
+  }
+
+  let headers = authHeaderCache.get(token);
+  if (!headers) {
+    // A process only ever sees a token or two; reset rather than track recency
+    if (authHeaderCache.size >= AUTH_HEADER_CACHE_SIZE) {
+      authHeaderCache.clear();
+    }
+    headers = Object.freeze({ Authorization: `Bearer ${token}` });
+    authHeaderCache.set(token, headers);
+  }
+  return headers;
 }
@@ -9,6 +9,7 @@ export {
   getRepoRoot,
   hasGit,
   getCurrentBranch,
+  findLatestFeature,
   checkFeatureBranch,
   findFeatureDirByPrefix,
   getFeaturePaths,
@@ -19,6 +20,7 @@ export {
 // Configuration and constants
 export {
   AGENT_CONFIG,
+  AGENT_KEYS,
   CLAUDE_LOCAL_PATH,
   BANNER,
   TAGLINE,
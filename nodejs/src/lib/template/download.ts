@@ -2,19 +2,31 @@
  * Template download module - downloads template assets from GitHub releases.
  */
 
-import { writeFileSync, existsSync, mkdirSync } from 'node:fs';
+import { createWriteStream, existsSync, mkdirSync, rmSync } from 'node:fs';
 import { join } from 'node:path';
+import { Readable } from 'node:stream';
+import { pipeline } from 'node:stream/promises';
+import type { ReadableStream as WebReadableStream } from 'node:stream/web';
 import { getAuthHeaders } from '../github/token.js';
-import { formatRateLimitError } from '../github/rate-limit.js';
+import { fetchLatestRelease, REPO_OWNER, REPO_NAME } from '../github/client.js';
+import { getDefaultCacheDir } from '../github/release-cache.js';
 import type { StepTracker } from '../ui/tracker.js';
 
 // GitHub API configuration
-export const REPO_OWNER = 'github';
-export const REPO_NAME = 'spec-kit';
+export { REPO_OWNER, REPO_NAME };
 export const API_URL = `https://api.github.com/repos/${REPO_OWNER}/${REPO_NAME}/releases/latest`;
 export const API_TIMEOUT = 30; // 30 seconds
+
+/**
+ * Headers sent with asset download requests; auth headers are added per call
+ */
+export const API_HEADERS: Readonly<Record<string, string>> = Object.freeze({
+  Accept: 'application/vnd.github+json',
+  'User-Agent': 'speckit-cli',
+});
 export const STREAM_TIMEOUT = 60; // 60 seconds for streaming download
 export const CHUNK_SIZE = 8192; // 8KB chunks
+export const DOWNLOAD_BUFFER_SIZE = 1024 * 1024; // 1MB write buffer for asset downloads
 
 /**
  * Asset naming pattern: spec-kit-template-{ai}-{version}.zip
@@ -50,6 +62,8 @@ export interface DownloadOptions {
   showProgress?: boolean;
   debug?: boolean;
   tracker?: StepTracker;
+  /** Directory for the release ETag cache (defaults to the user cache dir) */
+  cacheDir?: string;
 }
 
 /**
@@ -99,32 +113,6 @@ export function getAvailableAssets(release: GitHubRelease): string[] {
     .map(asset => asset.name);
 }
 
-/**
- * Fetch the latest release info from GitHub.
- */
-export async function fetchLatestRelease(options?: {
-  githubToken?: string;
-}): Promise<GitHubRelease> {
-  const headers = getAuthHeaders(options?.githubToken);
-
-  const response = await fetch(API_URL, {
-    headers: {
-      Accept: 'application/vnd.github+json',
-      'User-Agent': 'speckit-cli',
-      ...headers,
-    },
-  });
-
-  if (!response.ok) {
-    if (response.status === 403 || response.status === 429) {
-      throw new Error(formatRateLimitError(response.status, response.headers, API_URL));
-    }
-    throw new Error(`GitHub API error: ${response.status} ${response.statusText}`);
-  }
-
-  return response.json() as Promise<GitHubRelease>;
-}
-
 /**
  * Download a template from GitHub releases.
  * 
@@ -142,7 +130,10 @@ export async function downloadTemplate(
 
   // Fetch release info
   tracker?.start('fetch', 'Fetching release info...');
-  const release = await fetchLatestRelease({ githubToken: options?.githubToken });
+  const release = await fetchLatestRelease({
+    token: options?.githubToken,
+    cacheDir: options?.cacheDir ?? getDefaultCacheDir(),
+  });
   tracker?.complete('fetch', `Found release ${release.tag_name}`);
 
   // Find matching asset
@@ -160,8 +151,8 @@ export async function downloadTemplate(
   const headers = getAuthHeaders(options?.githubToken);
   const response = await fetch(asset.browser_download_url, {
     headers: {
+      ...API_HEADERS,
       Accept: 'application/octet-stream',
-      'User-Agent': 'speckit-cli',
       ...headers,
     },
   });
@@ -178,10 +169,20 @@ export async function downloadTemplate(
     mkdirSync(destDir, { recursive: true });
   }
   
-  // Get the response as an ArrayBuffer and write to file
-  const arrayBuffer = await response.arrayBuffer();
-  const buffer = Buffer.from(arrayBuffer);
-  writeFileSync(zipPath, buffer);
+  // Stream the body straight to disk rather than buffering the whole zip
+  if (!response.body) {
+    throw new Error('Download failed: empty response body');
+  }
+  try {
+    await pipeline(
+      Readable.fromWeb(response.body as WebReadableStream<Uint8Array>),
+      createWriteStream(zipPath, { highWaterMark: DOWNLOAD_BUFFER_SIZE })
+    );
+  } catch (error) {
+    // Don't leave a truncated zip behind for the extract step to pick up
+    rmSync(zipPath, { force: true });
+    throw error;
+  }
   
   tracker?.complete('download', `Downloaded ${asset.name}`);
 
@@ -2,10 +2,10 @@
  * Template extraction module - extracts ZIP templates to project directories.
  */
 
-import { existsSync, mkdirSync, rmSync, readdirSync, statSync, renameSync, copyFileSync, unlinkSync, readFileSync, writeFileSync } from 'node:fs';
+import { existsSync, mkdirSync, rmSync, readdirSync, statSync, renameSync, copyFileSync, unlinkSync, readFileSync } from 'node:fs';
 import { join, dirname, basename } from 'node:path';
 import type { StepTracker } from '../ui/tracker.js';
-import { mergeJsonFiles } from './merge.js';
+import { mergeJsonFiles, writeJsonFile } from './merge.js';
 
 /**
  * Tracker keys used during extraction.
@@ -102,7 +102,7 @@ export async function mergeWithExisting(
           mkdirSync(parentDir, { recursive: true });
         }
         // Write the merged content
-        writeFileSync(destPath, JSON.stringify(merged, null, 2) + '\n');
+        writeJsonFile(destPath, merged);
       } else {
         // Ensure parent directory exists
         const parentDir = dirname(destPath);
@@ -3,7 +3,7 @@
  * Ported from Python specify_cli/__init__.py merge_json_files
  */
 
-import { readFileSync, existsSync } from 'fs';
+import { readFileSync, writeFileSync, renameSync, rmSync, realpathSync, statSync, chmodSync } from 'fs';
 
 /**
  * Recursively merge update dict into base dict.
@@ -48,6 +48,53 @@ export function deepMerge(
   return result;
 }
 
+/**
+ * Merge update into target in place, with the same rules as deepMerge.
+ * Only used on freshly parsed JSON that nothing else references, so the
+ * defensive copy deepMerge makes at every level can be skipped.
+ */
+function mergeInPlace(
+  target: Record<string, unknown>,
+  update: Record<string, unknown>
+): Record<string, unknown> {
+  const keys = Object.keys(update);
+
+  // Nothing to apply, or re-applying the same object
+  if (keys.length === 0 || target === update) {
+    return target;
+  }
+  // Nothing to merge with: copy the update across in one pass
+  if (Object.keys(target).length === 0) {
+    return Object.assign(target, update);
+  }
+
+  for (const key of keys) {
+    const value = update[key];
+
+    // New subtree: take it wholesale, there is nothing to walk into
+    if (!Object.hasOwn(target, key)) {
+      target[key] = value;
+      continue;
+    }
+
+    const existing = target[key];
+    if (
+      typeof existing === 'object' &&
+      existing !== null &&
+      !Array.isArray(existing) &&
+      typeof value === 'object' &&
+      value !== null &&
+      !Array.isArray(value)
+    ) {
+      mergeInPlace(existing as Record<string, unknown>, value as Record<string, unknown>);
+    } else {
+      target[key] = value;
+    }
+  }
+
+  return target;
+}
+
 /**
  * Merge new JSON content into existing JSON file.
  *
@@ -67,17 +114,52 @@ export function mergeJsonFiles(
   newContent: Record<string, unknown>,
   _verbose = false
 ): Record<string, unknown> {
-  // If file doesn't exist, just return new content
-  if (!existsSync(existingPath)) {
+  // A single read both checks for the file and loads it; a missing file
+  // (ENOENT) lands in the catch below like invalid JSON does
+  try {
+    const existingContent: unknown = JSON.parse(readFileSync(existingPath, 'utf-8'));
+    if (typeof existingContent !== 'object' || existingContent === null || Array.isArray(existingContent)) {
+      // Not a JSON object, nothing to merge into
+      return newContent;
+    }
+    // The parsed object is ours alone, so merge into it directly
+    return mergeInPlace(existingContent as Record<string, unknown>, newContent);
+  } catch {
+    // Missing file or invalid JSON, just use new content
     return newContent;
   }
+}
 
+/**
+ * Write JSON content to a file atomically.
+ *
+ * The content goes to a sibling temp file that is then renamed over the
+ * target, so an interrupted write never leaves a truncated settings file.
+ * A symlinked target is written through to the file it points at, and an
+ * existing file keeps its permission bits.
+ *
+ * @param filePath - Path of the JSON file to write
+ * @param content - JSON content to serialize (2-space indent, trailing newline)
+ */
+export function writeJsonFile(filePath: string, content: unknown): void {
+  let targetPath = filePath;
+  let mode: number | undefined;
   try {
-    const fileContent = readFileSync(existingPath, 'utf-8');
-    const existingContent = JSON.parse(fileContent) as Record<string, unknown>;
-    return deepMerge(existingContent, newContent);
+    targetPath = realpathSync(filePath);
+    mode = statSync(targetPath).mode & 0o7777;
   } catch {
-    // If file is invalid JSON, just use new content
-    return newContent;
+    // No file yet, create it with default permissions
+  }
+
+  const tempPath = `${targetPath}.${process.pid}.tmp`;
+  try {
+    writeFileSync(tempPath, JSON.stringify(content, null, 2) + '\n');
+    if (mode !== undefined) {
+      chmodSync(tempPath, mode);
+    }
+    renameSync(tempPath, targetPath);
+  } catch (e) {
+    rmSync(tempPath, { force: true });
+    throw e;
   }
 }
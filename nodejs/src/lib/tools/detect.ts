@@ -8,6 +8,11 @@ import { existsSync, statSync } from 'fs';
 import { CLAUDE_LOCAL_PATH } from '../config.js';
 import type { StepTracker } from '../ui/tracker.js';
 
+/**
+ * Command used to locate executables on PATH: 'where' on Windows, 'which' on Unix
+ */
+const LOOKUP_COMMAND = process.platform === 'win32' ? 'where' : 'which';
+
 /**
  * Check if a tool is installed.
  *
@@ -37,11 +42,8 @@ export function checkTool(tool: string, tracker?: StepTracker): boolean {
     }
   }
 
-  // Use 'where' on Windows, 'which' on Unix
-  const cmd = process.platform === 'win32' ? `where ${tool}` : `which ${tool}`;
-
   try {
-    execSync(cmd, { stdio: 'ignore' });
+    execSync(`${LOOKUP_COMMAND} ${tool}`, { stdio: 'ignore' });
     if (tracker) {
       tracker.complete(tool, 'available');
     }
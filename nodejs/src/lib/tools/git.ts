@@ -4,21 +4,45 @@
  */
 
 import { execSync } from 'child_process';
-import { existsSync } from 'fs';
+import { statSync } from 'fs';
+import { dirname, join, resolve } from 'path';
 
 /**
  * Check if the specified path is inside a git repository.
  *
+ * Walks up from the path looking for a `.git` directory, which answers the
+ * common case without spawning git. A `.git` file (worktree or submodule)
+ * or a GIT_DIR override falls back to `git rev-parse`.
+ *
  * @param path - Path to check (defaults to current working directory)
  * @returns True if inside a git repo, false otherwise
  */
 export function isGitRepo(path?: string): boolean {
-  const checkPath = path || process.cwd();
+  const checkPath = resolve(path || process.cwd());
 
-  if (!existsSync(checkPath)) {
+  try {
+    if (!statSync(checkPath).isDirectory()) {
+      return false;
+    }
+  } catch {
     return false;
   }
 
+  if (!process.env.GIT_DIR) {
+    for (let dir = checkPath; ; dir = dirname(dir)) {
+      const dotGit = statSync(join(dir, '.git'), { throwIfNoEntry: false });
+      if (dotGit?.isDirectory()) {
+        return true;
+      }
+      if (dotGit) {
+        break;
+      }
+      if (dir === dirname(dir)) {
+        return false;
+      }
+    }
+  }
+
   try {
     execSync('git rev-parse --is-inside-work-tree', {
       cwd: checkPath,
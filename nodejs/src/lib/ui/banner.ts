@@ -18,6 +18,11 @@ const COLORS = [
   chalk.whiteBright,
 ];
 
+/**
+ * Banner art split into lines once at load
+ */
+const BANNER_LINES = BANNER.trim().split('\n');
+
 /**
  * Center text in the terminal
  */
@@ -39,9 +44,7 @@ function centerText(text: string): string {
  * Display the ASCII art banner.
  */
 export function showBanner(): void {
-  const bannerLines = BANNER.trim().split('\n');
-
-  const coloredBanner = bannerLines.map((line, i) => COLORS[i % COLORS.length]!(line)).join('\n');
+  const coloredBanner = BANNER_LINES.map((line, i) => COLORS[i % COLORS.length]!(line)).join('\n');
 
   console.log(centerText(coloredBanner));
   console.log(centerText(chalk.italic.yellowBright(TAGLINE)));
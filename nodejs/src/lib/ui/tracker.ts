@@ -20,21 +20,31 @@ export interface Step {
   detail: string;
 }
 
+/**
+ * Sort order of each status, shared by every tracker
+ */
+export const STATUS_ORDER: Readonly<Record<StepStatus, number>> = Object.freeze({
+  pending: 0,
+  running: 1,
+  done: 2,
+  error: 3,
+  skipped: 4,
+});
+
 /**
  * Track and render hierarchical steps without emojis, similar to Claude Code tree output.
  * Supports live auto-refresh via an attached refresh callback.
  */
 export class StepTracker {
   public title: string;
-  public steps: Step[] = [];
-  public readonly statusOrder: Record<StepStatus, number> = {
-    pending: 0,
-    running: 1,
-    done: 2,
-    error: 3,
-    skipped: 4,
-  };
+  private readonly _steps: Step[] = [];
+  /** Steps in insertion order; read-only so they stay in sync with the key index */
+  public readonly steps: readonly Step[] = this._steps;
+  public readonly statusOrder: Readonly<Record<StepStatus, number>> = STATUS_ORDER;
+  private _stepIndex = new Map<string, Step>();
   private _refreshCallback?: () => void;
+  private _batchDepth = 0;
+  private _pendingRefresh = false;
 
   constructor(title: string) {
     this.title = title;
@@ -47,13 +57,31 @@ export class StepTracker {
     this._refreshCallback = cb;
   }
 
+  /**
+   * Apply several updates with a single refresh at the end.
+   * The refresh callback is held back while `updates` runs and fires once
+   * afterwards if any step changed.
+   */
+  batch(updates: () => void): void {
+    this._batchDepth++;
+    try {
+      updates();
+    } finally {
+      this._batchDepth--;
+      if (this._batchDepth === 0 && this._pendingRefresh) {
+        this._pendingRefresh = false;
+        this._maybeRefresh();
+      }
+    }
+  }
+
   /**
    * Add a new step with the given key and label.
    * If a step with the same key already exists, this is a no-op.
    */
   add(key: string, label: string): void {
-    if (!this.steps.find((s) => s.key === key)) {
-      this.steps.push({ key, label, status: 'pending', detail: '' });
+    if (!this._stepIndex.has(key)) {
+      this._addStep(key, label, 'pending', '');
       this._maybeRefresh();
     }
   }
@@ -91,7 +119,7 @@ export class StepTracker {
    * If the step doesn't exist, it will be created with the key as the label.
    */
   private _update(key: string, status: StepStatus, detail: string): void {
-    const step = this.steps.find((s) => s.key === key);
+    const step = this._stepIndex.get(key);
     if (step) {
       step.status = status;
       if (detail) {
@@ -100,15 +128,29 @@ export class StepTracker {
       this._maybeRefresh();
     } else {
       // Auto-create step if it doesn't exist
-      this.steps.push({ key, label: key, status, detail });
+      this._addStep(key, key, status, detail);
       this._maybeRefresh();
     }
   }
 
+  /**
+   * Append a step and index it by key.
+   * Every step is built with the same property order so they share one shape.
+   */
+  private _addStep(key: string, label: string, status: StepStatus, detail: string): void {
+    const step: Step = { key, label, status, detail };
+    this._steps.push(step);
+    this._stepIndex.set(key, step);
+  }
+
   /**
    * Call the refresh callback if one is attached.
    */
   private _maybeRefresh(): void {
+    if (this._batchDepth > 0) {
+      this._pendingRefresh = true;
+      return;
+    }
     if (this._refreshCallback) {
       try {
         this._refreshCallback();
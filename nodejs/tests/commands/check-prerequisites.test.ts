@@ -3,10 +3,7 @@
  * Ported from tests/acceptance/ Python tests
  */
 
-import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
-import { existsSync, mkdirSync, writeFileSync, rmSync } from 'fs';
-import { join } from 'path';
-import { tmpdir } from 'os';
+import { describe, it, expect, vi } from 'vitest';
 
 // Mock child_process for git commands
 vi.mock('child_process', async () => {
@@ -5,46 +5,55 @@
 
 import { describe, it, expect } from 'vitest';
 import { AGENT_CONFIG } from '../../src/lib/config.js';
+import { AGENT_PARTITION } from '../setup.js';
+
+/**
+ * Name shown in the check tracker for each agent key
+ */
+const DISPLAY_NAMES: Record<string, string> = {
+  copilot: 'GitHub Copilot',
+  claude: 'Claude Code',
+  gemini: 'Gemini CLI',
+  'cursor-agent': 'Cursor',
+  qwen: 'Qwen Code',
+  opencode: 'opencode',
+  codex: 'Codex CLI',
+  windsurf: 'Windsurf',
+  kilocode: 'Kilo Code',
+  auggie: 'Auggie CLI',
+  codebuddy: 'CodeBuddy',
+  roo: 'Roo Code',
+  q: 'Amazon Q Developer CLI',
+  amp: 'Amp',
+  shai: 'SHAI',
+};
 
 describe('Check Command Behavior', () => {
-  it('shows banner at start', () => {
-    // The check command displays the ASCII banner
-    // This is verified by the function calling showBanner()
-    expect(true).toBe(true);
-  });
+  it.todo('shows banner at start');
 
-  it('uses StepTracker for display', () => {
-    // The check command uses StepTracker to show progress
-    expect(true).toBe(true);
-  });
+  it.todo('uses StepTracker for display');
 });
 
 describe('Check Tools Scanned', () => {
   it('checks all CLI-required agents from AGENT_CONFIG', () => {
-    const cliAgents = Object.entries(AGENT_CONFIG)
-      .filter(([_, config]) => config.requiresCli)
-      .map(([key]) => key);
-
     const expected = [
       'claude', 'gemini', 'qwen', 'opencode', 'codex',
       'auggie', 'codebuddy', 'q', 'amp', 'shai'
     ];
 
-    expect(cliAgents.sort()).toEqual(expected.sort());
-    expect(cliAgents).toHaveLength(10);
+    for (const agent of expected) {
+      expect(AGENT_PARTITION.cli.has(agent)).toBe(true);
+    }
+    expect(AGENT_PARTITION.cli.size).toBe(10);
   });
 
   it('IDE-based agents are marked as skipped not checked', () => {
-    const ideAgents = Object.entries(AGENT_CONFIG)
-      .filter(([_, config]) => !config.requiresCli)
-      .map(([key]) => key);
-
     const expected = ['copilot', 'cursor-agent', 'windsurf', 'kilocode', 'roo'];
 
     for (const agent of expected) {
-      expect(ideAgents).toContain(agent);
+      expect(AGENT_PARTITION.ide.has(agent)).toBe(true);
     }
-    expect(ideAgents).toHaveLength(5);
+    expect(AGENT_PARTITION.ide.size).toBe(5);
   });
 
   it('checks for git command', () => {
@@ -64,7 +73,7 @@ describe('Check Tools Scanned', () => {
 describe('Check Output Format', () => {
   it('tracker shows human-readable agent names', () => {
     // Uses config.name not the key
-    for (const [key, config] of Object.entries(AGENT_CONFIG)) {
+    for (const config of Object.values(AGENT_CONFIG)) {
       expect(config.name).toBeDefined();
       expect(typeof config.name).toBe('string');
       // Name should be more human-readable than key
@@ -72,16 +81,12 @@ describe('Check Output Format', () => {
     }
   });
 
-  it('copilot display name is GitHub Copilot', () => {
-    expect(AGENT_CONFIG.copilot.name).toBe('GitHub Copilot');
-  });
-
-  it('claude display name is Claude Code', () => {
-    expect(AGENT_CONFIG.claude.name).toBe('Claude Code');
+  it.each(Object.entries(DISPLAY_NAMES))('%s display name is %s', (key, name) => {
+    expect(AGENT_CONFIG[key]?.name).toBe(name);
   });
 
-  it('q display name is Amazon Q Developer CLI', () => {
-    expect(AGENT_CONFIG.q.name).toBe('Amazon Q Developer CLI');
+  it('no agents beyond those with a known display name', () => {
+    expect(new Set(Object.keys(AGENT_CONFIG))).toEqual(new Set(Object.keys(DISPLAY_NAMES)));
   });
 });
 
@@ -95,16 +100,14 @@ describe('Check Completion Message', () => {
 
 describe('Agent CLI Requirement Distribution', () => {
   it('exactly 10 CLI-required agents', () => {
-    const cliAgents = Object.values(AGENT_CONFIG).filter(c => c.requiresCli);
-    expect(cliAgents).toHaveLength(10);
+    expect(AGENT_PARTITION.cli.size).toBe(10);
   });
 
   it('exactly 5 IDE-based agents', () => {
-    const ideAgents = Object.values(AGENT_CONFIG).filter(c => !c.requiresCli);
-    expect(ideAgents).toHaveLength(5);
+    expect(AGENT_PARTITION.ide.size).toBe(5);
   });
 
   it('total is 15 agents', () => {
-    expect(Object.keys(AGENT_CONFIG)).toHaveLength(15);
+    expect(AGENT_PARTITION.all.size).toBe(15);
   });
 });
@@ -3,244 +3,226 @@
  * Ported from tests/acceptance/test_init_command.py
  */
 
-import { describe, it, expect } from 'vitest';
-import { platform } from 'node:os';
-import { AGENT_CONFIG } from '../../src/lib/config.js';
+import { describe, it, expect, beforeAll } from 'vitest';
+import { basename, resolve } from 'path';
+import { stripVTControlCharacters } from 'util';
+import { AGENT_CONFIG, AGENT_KEYS } from '../../src/lib/config.js';
+import { AGENT_OUTPUT_CONFIG } from '../../src/lib/template/generator.js';
+import { API_URL, REPO_OWNER, REPO_NAME, getAssetNamePattern } from '../../src/lib/template/download.js';
+import { DEFAULT_AI_KEY } from '../../src/lib/ui/select.js';
+import { getNextSteps, resolveProjectTarget } from '../../src/commands/init.js';
+import { createProgram } from '../../src/program.js';
+import { AGENT_PARTITION, IS_WINDOWS } from '../setup.js';
 
-describe('Init Command Arguments', () => {
-  it('accepts optional project_name positional argument', () => {
-    // specify init <project-name>
-    const args = ['my-project'];
-    expect(args[0]).toBe('my-project');
-  });
+/**
+ * Init options beyond --ai, each checked against the registered init command
+ */
+const INIT_FLAGS = [
+  '--ignore-agent-tools',
+  '--no-git',
+  '--here',
+  '--force',
+  '--skip-tls',
+  '--debug',
+  '--github-token',
+];
 
-  it('--ai option specifies AI assistant', () => {
-    const validAgents = Object.keys(AGENT_CONFIG);
-    expect(validAgents).toHaveLength(15);
-    expect(validAgents).toContain('copilot');
-    expect(validAgents).toContain('claude');
-  });
+/**
+ * Project names with separators, digits and mixed case
+ */
+const SPECIAL_NAMES = ['my-project', 'my_project', 'my.project', 'MyProject', 'project123', '123project'];
 
-  it('--ignore-agent-tools flag exists', () => {
-    const flag = '--ignore-agent-tools';
-    expect(flag).toBe('--ignore-agent-tools');
-  });
+/**
+ * Device names Windows reserves regardless of extension
+ */
+const RESERVED_WINDOWS_NAMES = ['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'LPT1', 'LPT2'];
 
-  it('--no-git flag exists', () => {
-    const flag = '--no-git';
-    expect(flag).toBe('--no-git');
-  });
+/**
+ * Optional slash commands listed after the core workflow
+ */
+const ENHANCEMENT_COMMANDS = ['clarify', 'analyze', 'checklist'];
 
-  it('--here flag exists', () => {
-    const flag = '--here';
-    expect(flag).toBe('--here');
-  });
+describe('Init Command Arguments', () => {
+  // Long flags and positionals registered on the real init command, read once for the describe
+  let initFlags: (string | undefined)[];
+  let initArgs: { name: string; required: boolean }[];
 
-  it('--force flag exists', () => {
-    const flag = '--force';
-    expect(flag).toBe('--force');
+  beforeAll(() => {
+    const init = createProgram().commands.find(cmd => cmd.name() === 'init');
+    initFlags = init?.options.map(opt => opt.long) ?? [];
+    initArgs = init?.registeredArguments.map(arg => ({ name: arg.name(), required: arg.required })) ?? [];
   });
 
-  it('--skip-tls flag exists', () => {
-    const flag = '--skip-tls';
-    expect(flag).toBe('--skip-tls');
+  it('accepts optional project_name positional argument', () => {
+    expect(initArgs).toEqual([{ name: 'project-name', required: false }]);
   });
 
-  it('--debug flag exists', () => {
-    const flag = '--debug';
-    expect(flag).toBe('--debug');
+  it('--ai option specifies AI assistant', () => {
+    expect(AGENT_PARTITION.all.size).toBe(15);
+    expect(AGENT_PARTITION.all.has('copilot')).toBe(true);
+    expect(AGENT_PARTITION.all.has('claude')).toBe(true);
   });
 
-  it('--github-token option exists', () => {
-    const option = '--github-token';
-    expect(option).toBe('--github-token');
+  it.each(INIT_FLAGS)('%s option exists', (flag) => {
+    expect(initFlags).toContain(flag);
   });
 });
 
 describe('Init Project Name Variants', () => {
   it('project name creates directory', () => {
-    const projectName = 'my-project';
-    expect(projectName).toBe('my-project');
+    expect(resolveProjectTarget('my-project')!.projectPath).toBe(resolve(process.cwd(), 'my-project'));
   });
 
   it('dot means current directory', () => {
-    const projectName = '.';
-    const isHere = projectName === '.';
-    expect(isHere).toBe(true);
+    expect(resolveProjectTarget('.')).toEqual({
+      projectName: basename(process.cwd()),
+      projectPath: process.cwd(),
+      inCurrentDir: true,
+    });
   });
 
   it('--here is equivalent to dot', () => {
-    // Both . and --here initialize in current directory
-    expect(true).toBe(true);
+    expect(resolveProjectTarget(undefined, true)).toEqual(resolveProjectTarget('.'));
+    expect(resolveProjectTarget('ignored', true)).toEqual(resolveProjectTarget('.'));
+  });
+
+  it('requires a project name or --here', () => {
+    expect(resolveProjectTarget(undefined)).toBeNull();
+    expect(resolveProjectTarget('')).toBeNull();
+  });
+
+  it.each(SPECIAL_NAMES)('project name %s resolves to a directory of the same name', (name) => {
+    const target = resolveProjectTarget(name);
+    expect(target).toEqual({ projectName: name, projectPath: resolve(name), inCurrentDir: false });
+    expect(basename(target!.projectPath)).toBe(name);
+  });
+
+  it.skipIf(IS_WINDOWS).each(RESERVED_WINDOWS_NAMES)('reserved Windows name %s is an ordinary name on Unix', (name) => {
+    expect(basename(resolveProjectTarget(name)!.projectPath)).toBe(name);
   });
 });
 
 describe('Init AI Agent Validation', () => {
   it('CLI-required agents check for installed tool', () => {
-    const cliAgents = Object.entries(AGENT_CONFIG)
-      .filter(([_, config]) => config.requiresCli)
-      .map(([key]) => key);
-
-    expect(cliAgents).toHaveLength(10);
+    expect(AGENT_PARTITION.cli.size).toBe(10);
   });
 
   it('IDE-based agents skip CLI tool check', () => {
-    const ideAgents = Object.entries(AGENT_CONFIG)
-      .filter(([_, config]) => !config.requiresCli)
-      .map(([key]) => key);
+    expect(AGENT_PARTITION.ide.size).toBe(5);
+    expect(AGENT_PARTITION.ide.has('copilot')).toBe(true);
+    expect(AGENT_PARTITION.ide.has('windsurf')).toBe(true);
+  });
+
+  it.each([...AGENT_PARTITION.all])('--ai accepts %s and has command output config', (agent) => {
+    const folder = AGENT_CONFIG[agent]?.folder;
+    const commandDir = AGENT_OUTPUT_CONFIG[agent]?.commandDir;
+
+    expect(folder).toBeDefined();
+    expect(commandDir?.startsWith(folder!)).toBe(true);
+  });
+
+  it('non-interactive default agent is copilot', () => {
+    expect(DEFAULT_AI_KEY).toBe('copilot');
+    expect(AGENT_PARTITION.ide.has(DEFAULT_AI_KEY)).toBe(true);
+  });
 
-    expect(ideAgents).toHaveLength(5);
-    expect(ideAgents).toContain('copilot');
-    expect(ideAgents).toContain('windsurf');
+  it.each(['bogus', 'Claude', ''])('--ai rejects unknown agent %j', (agent) => {
+    // init validates --ai against AGENT_KEYS
+    expect(AGENT_KEYS.has(agent)).toBe(false);
   });
 
   it('missing tool shows install URL from config', () => {
     // Each CLI agent has an installUrl
-    const cliAgents = Object.entries(AGENT_CONFIG)
-      .filter(([_, config]) => config.requiresCli);
-
-    for (const [key, config] of cliAgents) {
-      expect(config.installUrl).not.toBeNull();
-      expect(config.installUrl).toContain('http');
+    for (const key of AGENT_PARTITION.cli) {
+      const config = AGENT_CONFIG[key];
+      expect(config?.installUrl).not.toBeNull();
+      expect(config?.installUrl).toContain('http');
     }
   });
 });
 
 describe('Init Template Download', () => {
   it('downloads from github/spec-kit repository', () => {
-    const repoUrl = 'api.github.com/repos/github/spec-kit/releases/latest';
-    expect(repoUrl).toContain('github/spec-kit');
+    expect(`${REPO_OWNER}/${REPO_NAME}`).toBe('github/spec-kit');
+    expect(API_URL).toContain(`/repos/${REPO_OWNER}/${REPO_NAME}/`);
   });
 
   it('asset name pattern format', () => {
-    const pattern = 'spec-kit-template-{ai}-{version}.zip';
-    expect(pattern).toContain('spec-kit-template');
-    expect(pattern).toContain('.zip');
+    const pattern = getAssetNamePattern('copilot');
+    expect(pattern.test('spec-kit-template-copilot-0.0.22.zip')).toBe(true);
+    expect(pattern.test('spec-kit-template-copilot-v0.0.22.zip')).toBe(true);
+    expect(pattern.test('spec-kit-template-copilot-0.0.22.tar.gz')).toBe(false);
   });
 
   it('example asset name', () => {
-    const example = 'spec-kit-template-copilot-0.0.22.zip';
-    expect(example).toMatch(/^spec-kit-template-\w+-[\d.]+\.zip$/);
+    expect(getAssetNamePattern('copilot').test('spec-kit-template-claude-0.0.22.zip')).toBe(false);
   });
 });
 
 describe('Init VSCode Settings Merge', () => {
-  it('settings.json is merged not replaced', () => {
-    // .vscode/settings.json special handling
-    const specialFile = '.vscode/settings.json';
-    expect(specialFile).toContain('settings.json');
-  });
+  it.todo('settings.json is merged not replaced');
 });
 
 describe('Init Git Initialization', () => {
-  it('initializes git by default', () => {
-    const defaultInitGit = true;
-    expect(defaultInitGit).toBe(true);
-  });
+  it.todo('initializes git by default');
 
-  it('--no-git skips initialization', () => {
-    const noGit = true;
-    expect(noGit).toBe(true);
-  });
+  it.todo('--no-git skips initialization');
 
-  it('commit message is exact', () => {
-    const commitMessage = 'Initial commit from Specify template';
-    expect(commitMessage).toBe('Initial commit from Specify template');
-  });
+  // test_commit_message is covered against a real repo in tests/lib/tools/git.test.ts
 });
 
 describe('Init Script Permissions', () => {
-  it('sh scripts in .speckit/scripts made executable', () => {
-    const scriptsPath = '.speckit/scripts';
-    expect(scriptsPath).toContain('.speckit');
-    expect(scriptsPath).toContain('scripts');
-  });
+  it.todo('sh scripts in .speckit/scripts made executable');
 
-  it('only scripts with shebang get execute bit', () => {
-    const shebang = '#!';
-    expect(shebang).toBe('#!');
-  });
+  it.todo('only scripts with shebang get execute bit');
 
-  it('permission setting skipped on Windows', () => {
-    if (platform() === 'win32') {
-      // No-op on Windows
-      expect(true).toBe(true);
-    }
-  });
+  it.todo('permission setting skipped on Windows');
 });
 
 describe('Init Output Messages', () => {
-  it('shows banner at start', () => {
-    // ASCII banner displayed
-    expect(true).toBe(true);
-  });
+  it.todo('shows banner at start');
 
-  it('shows security notice', () => {
-    const notice = 'agent folder security';
-    expect(notice).toContain('security');
-  });
+  it.todo('shows security notice');
 
-  it('shows next steps panel', () => {
-    const panel = 'next steps';
-    expect(panel).toContain('next');
-  });
+  it.todo('shows next steps panel');
 });
 
 describe('Init Codex Special Handling', () => {
-  it('codex shows CODEX_HOME instruction', () => {
-    const envVar = 'CODEX_HOME';
-    expect(envVar).toBe('CODEX_HOME');
-  });
+  it.todo('codex shows CODEX_HOME instruction');
 
-  it('Windows uses setx command', () => {
-    if (platform() === 'win32') {
-      const cmd = 'setx CODEX_HOME';
-      expect(cmd).toContain('setx');
-    }
-  });
+  it.todo('Windows uses setx command');
 
-  it('Unix uses export command', () => {
-    if (platform() !== 'win32') {
-      const cmd = 'export CODEX_HOME=';
-      expect(cmd).toContain('export');
-    }
-  });
+  it.todo('Unix uses export command');
 });
 
+/**
+ * Next steps panel text without colour codes
+ */
+function nextSteps(projectName: string, selectedAi: string, inCurrentDir: boolean): string {
+  return stripVTControlCharacters(getNextSteps(projectName, selectedAi, inCurrentDir));
+}
+
 describe('Init Next Steps Content', () => {
   it('shows cd command for new directory', () => {
-    const cdCommand = 'cd <project-name>';
-    expect(cdCommand).toContain('cd');
+    expect(nextSteps('my-project', 'copilot', false)).toContain('cd my-project');
+    expect(nextSteps('my-project', 'copilot', true)).not.toContain('cd my-project');
   });
 
   it('shows slash commands in order', () => {
-    const commands = [
+    const commands = nextSteps('p', 'copilot', false).match(/\/speckit\.\w+/g)?.slice(0, 5);
+
+    expect(commands).toEqual([
       '/speckit.constitution',
-      '/speckit.speckit',
+      '/speckit.specify',
       '/speckit.plan',
       '/speckit.tasks',
       '/speckit.implement',
-    ];
-
-    expect(commands).toHaveLength(5);
-    expect(commands[0]).toBe('/speckit.constitution');
-    expect(commands[4]).toBe('/speckit.implement');
+    ]);
   });
 });
 
 describe('Init Enhancement Commands', () => {
-  it('shows clarify command', () => {
-    const cmd = '/speckit.clarify';
-    expect(cmd).toContain('clarify');
-  });
-
-  it('shows analyze command', () => {
-    const cmd = '/speckit.analyze';
-    expect(cmd).toContain('analyze');
-  });
-
-  it('shows checklist command', () => {
-    const cmd = '/speckit.checklist';
-    expect(cmd).toContain('checklist');
+  it.each(ENHANCEMENT_COMMANDS)('shows %s command', (name) => {
+    expect(nextSteps('p', 'copilot', false)).toContain(`/speckit.${name}`);
   });
 });
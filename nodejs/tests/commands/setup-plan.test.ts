@@ -3,8 +3,8 @@
  * Tests the setup-plan command that copies plan template to feature directory.
  */
 
-import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
-import { existsSync, mkdirSync, writeFileSync, rmSync, readFileSync } from 'fs';
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { existsSync, mkdirSync, mkdtempSync, writeFileSync, rmSync, readFileSync } from 'fs';
 import { join } from 'path';
 import { tmpdir } from 'os';
 
@@ -44,14 +44,11 @@ describe('SetupPlan Behavior', () => {
   let tempDir: string;
 
   beforeEach(() => {
-    tempDir = join(tmpdir(), `setup-plan-test-${Date.now()}`);
-    mkdirSync(tempDir, { recursive: true });
+    tempDir = mkdtempSync(join(tmpdir(), 'setup-plan-test-'));
   });
 
   afterEach(() => {
-    if (existsSync(tempDir)) {
-      rmSync(tempDir, { recursive: true, force: true });
-    }
+    rmSync(tempDir, { recursive: true, force: true });
   });
 
   it('creates feature directory if it does not exist', () => {
@@ -104,7 +101,7 @@ describe('SetupPlan Error Handling', () => {
   });
 
   it('creates empty plan.md if template missing', () => {
-    const tempDir = join(tmpdir(), `plan-no-template-${Date.now()}`);
+    const tempDir = mkdtempSync(join(tmpdir(), 'plan-no-template-'));
     const featureDir = join(tempDir, 'specs', '001-test-feature');
     mkdirSync(featureDir, { recursive: true });
 
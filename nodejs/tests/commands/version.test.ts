@@ -3,14 +3,24 @@
  * Ported from tests/acceptance/test_version_command.py
  */
 
-import { describe, it, expect } from 'vitest';
-import { platform, arch } from 'node:os';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { mkdtempSync, rmSync } from 'node:fs';
+import { join } from 'node:path';
+import { platform, arch, release, tmpdir } from 'node:os';
+import { fetchLatestRelease, getTemplateVersion } from '../../src/lib/github/client.js';
+import { getLatestTemplateVersion } from '../../src/commands/version.js';
+import { RUN_NETWORK_TESTS } from '../setup.js';
+
+/** System info shown by the version command, probed once for the whole file */
+const SYSTEM_INFO = {
+  nodeVersion: process.version,
+  platform: platform(),
+  arch: arch(),
+  osVersion: release(),
+} as const;
 
 describe('Version Command Behavior', () => {
-  it('shows banner at start', () => {
-    // Version command displays ASCII banner
-    expect(true).toBe(true);
-  });
+  it.todo('shows banner at start');
 
   it('CLI version comes from package.json', () => {
     // Version is read from package.json
@@ -27,35 +37,19 @@ describe('Version Command Behavior', () => {
 });
 
 describe('Version System Info', () => {
-  it('shows Node.js version', () => {
-    const nodeVersion = process.version;
-    expect(nodeVersion).toMatch(/^v\d+\.\d+\.\d+/);
-  });
-
-  it('shows platform', () => {
-    const currentPlatform = platform();
-    expect(['win32', 'linux', 'darwin']).toContain(currentPlatform);
-  });
-
-  it('shows architecture', () => {
-    const currentArch = arch();
-    expect(currentArch).toBeTruthy();
-    // Common architectures
-    expect(['x64', 'arm64', 'ia32', 'arm']).toContain(currentArch);
-  });
-
-  it('shows OS version is available', () => {
-    const release = require('node:os').release();
-    expect(release).toBeTruthy();
-    expect(typeof release).toBe('string');
+  it.each<[string, string, (value: string) => boolean]>([
+    ['Node.js version', SYSTEM_INFO.nodeVersion, (v: string) => /^v\d+\.\d+\.\d+/.test(v)],
+    ['platform', SYSTEM_INFO.platform, (v: string) => ['win32', 'linux', 'darwin'].includes(v)],
+    ['architecture', SYSTEM_INFO.arch, (v: string) => ['x64', 'arm64', 'ia32', 'arm'].includes(v)],
+    ['OS version', SYSTEM_INFO.osVersion, (v: string) => v.length > 0],
+  ])('shows %s', (_label, value, isValid) => {
+    expect(typeof value).toBe('string');
+    expect(isValid(value)).toBe(true);
   });
 });
 
 describe('Version Output Format', () => {
-  it('uses table or structured format', () => {
-    // Output is formatted in a structured way
-    expect(true).toBe(true);
-  });
+  it.todo('uses table or structured format');
 
   it('panel title concept', () => {
     const title = 'Speckit CLI Information';
@@ -98,9 +92,54 @@ describe('Version GitHub Fetch', () => {
   });
 });
 
+describe('getLatestTemplateVersion', () => {
+  // Explicit cache dir so the tests never touch the user cache
+  let cacheDir: string;
+
+  beforeEach(() => {
+    cacheDir = mkdtempSync(join(tmpdir(), 'version-cache-'));
+  });
+
+  afterEach(() => {
+    rmSync(cacheDir, { recursive: true, force: true });
+  });
+
+  it('replays the cached ETag and reuses the tag on 304', async () => {
+    const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(
+        new Response(JSON.stringify({ tag_name: 'v0.0.22' }), { headers: { ETag: '"abc123"' } })
+      )
+      .mockResolvedValueOnce(new Response(null, { status: 304 }));
+
+    expect(await getLatestTemplateVersion(undefined, cacheDir)).toBe('v0.0.22');
+    expect(await getLatestTemplateVersion(undefined, cacheDir)).toBe('v0.0.22');
+
+    expect(fetchSpy).toHaveBeenLastCalledWith(
+      expect.any(String),
+      expect.objectContaining({
+        headers: expect.objectContaining({ 'If-None-Match': '"abc123"' }),
+      })
+    );
+  });
+
+  it('returns null when the request fails', async () => {
+    vi.spyOn(globalThis, 'fetch').mockRejectedValueOnce(new Error('offline'));
+    expect(await getLatestTemplateVersion(undefined, cacheDir)).toBeNull();
+  });
+});
+
+describe.runIf(RUN_NETWORK_TESTS)('Version GitHub Fetch (live network)', () => {
+  it('fetches the latest template release', async () => {
+    const release = await fetchLatestRelease();
+
+    expect(release.tag_name).toMatch(/^v?\d+\.\d+\.\d+/);
+    expect(getTemplateVersion(release)).not.toMatch(/^v/);
+  }, 30000);
+});
+
 describe('Version Info Values', () => {
   it('Node.js version format', () => {
-    const version = process.version;
+    const version = SYSTEM_INFO.nodeVersion;
     // Should be like "v18.0.0" or "v20.11.0"
     expect(version.startsWith('v')).toBe(true);
     const parts = version.slice(1).split('.');
@@ -108,12 +147,10 @@ describe('Version Info Values', () => {
   });
 
   it('platform is valid', () => {
-    const plat = platform();
-    expect(['win32', 'darwin', 'linux', 'freebsd', 'openbsd', 'sunos', 'aix']).toContain(plat);
+    expect(['win32', 'darwin', 'linux', 'freebsd', 'openbsd', 'sunos', 'aix']).toContain(SYSTEM_INFO.platform);
   });
 
   it('arch is valid', () => {
-    const architecture = arch();
-    expect(['arm', 'arm64', 'ia32', 'loong64', 'mips', 'mipsel', 'ppc', 'ppc64', 'riscv64', 's390', 's390x', 'x64']).toContain(architecture);
+    expect(['arm', 'arm64', 'ia32', 'loong64', 'mips', 'mipsel', 'ppc', 'ppc64', 'riscv64', 's390', 's390x', 'x64']).toContain(SYSTEM_INFO.arch);
   });
 });
@@ -14,32 +14,30 @@ import {
   FileSystemError,
 } from '../../src/lib/errors.js';
 
-describe('SpecifyError', () => {
-  describe('constructor', () => {
-    it('should include message in error', () => {
-      const error = new SpecifyError('Something went wrong');
-      expect(error.message).toBe('Something went wrong');
-    });
-
-    it('should include exit code in error', () => {
-      const error = new SpecifyError('Error', ExitCode.GENERAL_ERROR);
-      expect(error.exitCode).toBe(ExitCode.GENERAL_ERROR);
-    });
-
-    it('should default to GENERAL_ERROR exit code', () => {
-      const error = new SpecifyError('Error');
-      expect(error.exitCode).toBe(ExitCode.GENERAL_ERROR);
-    });
-
-    it('should include optional details', () => {
-      const error = new SpecifyError('Error', ExitCode.GENERAL_ERROR, 'Details here');
-      expect(error.details).toBe('Details here');
-    });
-
-    it('should set error name correctly', () => {
-      const error = new SpecifyError('Error');
-      expect(error.name).toBe('SpecifyError');
-    });
+describe('SpecifyError constructor', () => {
+  it('should include message in error', () => {
+    const error = new SpecifyError('Something went wrong');
+    expect(error.message).toBe('Something went wrong');
+  });
+
+  it('should include exit code in error', () => {
+    const error = new SpecifyError('Error', ExitCode.GENERAL_ERROR);
+    expect(error.exitCode).toBe(ExitCode.GENERAL_ERROR);
+  });
+
+  it('should default to GENERAL_ERROR exit code', () => {
+    const error = new SpecifyError('Error');
+    expect(error.exitCode).toBe(ExitCode.GENERAL_ERROR);
+  });
+
+  it('should include optional details', () => {
+    const error = new SpecifyError('Error', ExitCode.GENERAL_ERROR, 'Details here');
+    expect(error.details).toBe('Details here');
+  });
+
+  it('should set error name correctly', () => {
+    const error = new SpecifyError('Error');
+    expect(error.name).toBe('SpecifyError');
   });
 });
 
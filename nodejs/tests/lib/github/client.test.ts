@@ -3,7 +3,10 @@
  * Tests for src/lib/github/client.ts
  */
 
-import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, vi } from 'vitest';
+import { existsSync, mkdtempSync, rmSync, writeFileSync } from 'fs';
+import { join } from 'path';
+import { tmpdir } from 'os';
 import {
   fetchLatestRelease,
   findTemplateAsset,
@@ -12,247 +15,292 @@ import {
   type GitHubRelease,
   type ReleaseAsset,
 } from '../../../src/lib/github/client.js';
+import { RELEASE_CACHE_FILE, readReleaseCache } from '../../../src/lib/github/release-cache.js';
 
-// Mock fetch globally
+// Mock fetch globally (replaces the network guard installed by tests/setup.ts)
 const mockFetch = vi.fn();
-global.fetch = mockFetch;
+vi.stubGlobal('fetch', mockFetch);
 
-describe('GitHub Client', () => {
-  beforeEach(() => {
-    vi.clearAllMocks();
+describe('GitHub Client fetchLatestRelease', () => {
+  const mockRelease: GitHubRelease = {
+    tag_name: 'v0.0.22',
+    name: 'Release v0.0.22',
+    published_at: '2024-01-15T12:00:00Z',
+    html_url: 'https://github.com/github/spec-kit/releases/tag/v0.0.22',
+    assets: [
+      {
+        name: 'spec-kit-template-copilot-sh-0.0.22.zip',
+        size: 123456,
+        browser_download_url: 'https://github.com/github/spec-kit/releases/download/v0.0.22/spec-kit-template-copilot-sh-0.0.22.zip',
+        content_type: 'application/zip',
+      },
+    ],
+  };
+
+  it('should fetch release info from GitHub API', async () => {
+    mockFetch.mockResolvedValueOnce(new Response(JSON.stringify(mockRelease)));
+
+    const release = await fetchLatestRelease();
+
+    expect(mockFetch).toHaveBeenCalledWith(
+      'https://api.github.com/repos/github/spec-kit/releases/latest',
+      expect.objectContaining({
+        headers: expect.objectContaining({
+          Accept: 'application/vnd.github.v3+json',
+          'User-Agent': 'speckit-cli/nodejs',
+        }),
+      })
+    );
+    expect(release.tag_name).toBe('v0.0.22');
   });
 
-  afterEach(() => {
-    vi.restoreAllMocks();
+  it('should include authorization header when token provided', async () => {
+    mockFetch.mockResolvedValueOnce(new Response(JSON.stringify(mockRelease)));
+
+    await fetchLatestRelease({ token: 'test-token' });
+
+    expect(mockFetch).toHaveBeenCalledWith(
+      expect.any(String),
+      expect.objectContaining({
+        headers: expect.objectContaining({
+          Authorization: 'Bearer test-token',
+        }),
+      })
+    );
   });
 
-  describe('fetchLatestRelease', () => {
-    const mockRelease: GitHubRelease = {
-      tag_name: 'v0.0.22',
-      name: 'Release v0.0.22',
-      published_at: '2024-01-15T12:00:00Z',
-      html_url: 'https://github.com/github/spec-kit/releases/tag/v0.0.22',
-      assets: [
-        {
-          name: 'spec-kit-template-copilot-sh-0.0.22.zip',
-          size: 123456,
-          browser_download_url: 'https://github.com/github/spec-kit/releases/download/v0.0.22/spec-kit-template-copilot-sh-0.0.22.zip',
-          content_type: 'application/zip',
+  it('should throw NetworkError on connection failure', async () => {
+    mockFetch.mockRejectedValueOnce(new Error('Connection refused'));
+
+    await expect(fetchLatestRelease()).rejects.toThrow('Failed to connect to GitHub API');
+  });
+
+  it('should throw RateLimitError on 403', async () => {
+    mockFetch.mockResolvedValueOnce(
+      new Response(null, {
+        status: 403,
+        statusText: 'Forbidden',
+        headers: {
+          'X-RateLimit-Limit': '60',
+          'X-RateLimit-Remaining': '0',
+          'X-RateLimit-Reset': '1700000000',
         },
-      ],
-    };
+      })
+    );
 
-    it('should fetch release info from GitHub API', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: true,
-        json: () => Promise.resolve(mockRelease),
-      });
+    await expect(fetchLatestRelease()).rejects.toThrow();
+  });
 
-      const release = await fetchLatestRelease();
+  it('should throw RateLimitError on 429', async () => {
+    mockFetch.mockResolvedValueOnce(
+      new Response(null, {
+        status: 429,
+        statusText: 'Too Many Requests',
+        headers: {
+          'Retry-After': '60',
+        },
+      })
+    );
 
-      expect(mockFetch).toHaveBeenCalledWith(
-        'https://api.github.com/repos/github/spec-kit/releases/latest',
-        expect.objectContaining({
-          headers: expect.objectContaining({
-            Accept: 'application/vnd.github.v3+json',
-            'User-Agent': 'speckit-cli/nodejs',
-          }),
-        })
-      );
-      expect(release.tag_name).toBe('v0.0.22');
-    });
+    await expect(fetchLatestRelease()).rejects.toThrow();
+  });
 
-    it('should include authorization header when token provided', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: true,
-        json: () => Promise.resolve(mockRelease),
-      });
+  it('should throw NetworkError on 404', async () => {
+    mockFetch.mockResolvedValueOnce(
+      new Response(null, { status: 404, statusText: 'Not Found' })
+    );
 
-      await fetchLatestRelease({ token: 'test-token' });
+    await expect(fetchLatestRelease()).rejects.toThrow('Release not found');
+  });
+
+  it('should throw NetworkError on other HTTP errors', async () => {
+    mockFetch.mockResolvedValueOnce(
+      new Response(null, { status: 500, statusText: 'Internal Server Error' })
+    );
 
-      expect(mockFetch).toHaveBeenCalledWith(
+    await expect(fetchLatestRelease()).rejects.toThrow('GitHub API error');
+  });
+
+  it('should store the ETag and replay it, reusing the body on 304', async () => {
+    const cacheDir = mkdtempSync(join(tmpdir(), 'release-cache-'));
+    try {
+      mockFetch.mockResolvedValueOnce(
+        new Response(JSON.stringify(mockRelease), { headers: { ETag: '"abc123"' } })
+      );
+      await fetchLatestRelease({ cacheDir });
+      expect(readReleaseCache(cacheDir)?.etag).toBe('"abc123"');
+
+      mockFetch.mockResolvedValueOnce(new Response(null, { status: 304 }));
+      const release = await fetchLatestRelease({ cacheDir });
+
+      expect(mockFetch).toHaveBeenLastCalledWith(
         expect.any(String),
         expect.objectContaining({
-          headers: expect.objectContaining({
-            Authorization: 'Bearer test-token',
-          }),
+          headers: expect.objectContaining({ 'If-None-Match': '"abc123"' }),
         })
       );
-    });
+      expect(release).toEqual(mockRelease);
+    } finally {
+      rmSync(cacheDir, { recursive: true, force: true });
+    }
+  });
 
-    it('should throw NetworkError on connection failure', async () => {
-      mockFetch.mockRejectedValueOnce(new Error('Connection refused'));
+  it('should retry without If-None-Match on a 304 with nothing cached', async () => {
+    mockFetch
+      .mockResolvedValueOnce(new Response(null, { status: 304 }))
+      .mockResolvedValueOnce(new Response(JSON.stringify(mockRelease)));
 
-      await expect(fetchLatestRelease()).rejects.toThrow('Failed to connect to GitHub API');
-    });
+    const release = await fetchLatestRelease();
 
-    it('should throw RateLimitError on 403', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: false,
-        status: 403,
-        statusText: 'Forbidden',
-        headers: new Headers({
-          'X-RateLimit-Limit': '60',
-          'X-RateLimit-Remaining': '0',
-          'X-RateLimit-Reset': '1700000000',
-        }),
-      });
+    expect(mockFetch).toHaveBeenCalledTimes(2);
+    const init = mockFetch.mock.calls[1]?.[1] as RequestInit;
+    expect(init.headers).not.toHaveProperty('If-None-Match');
+    expect(release).toEqual(mockRelease);
+  });
 
-      await expect(fetchLatestRelease()).rejects.toThrow();
-    });
+  it('should not send If-None-Match without a cache dir', async () => {
+    mockFetch.mockResolvedValueOnce(
+      new Response(JSON.stringify(mockRelease), { headers: { ETag: '"abc123"' } })
+    );
 
-    it('should throw RateLimitError on 429', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: false,
-        status: 429,
-        statusText: 'Too Many Requests',
-        headers: new Headers({
-          'Retry-After': '60',
-        }),
-      });
-
-      await expect(fetchLatestRelease()).rejects.toThrow();
-    });
-
-    it('should throw NetworkError on 404', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: false,
-        status: 404,
-        statusText: 'Not Found',
-        headers: new Headers(),
-      });
-
-      await expect(fetchLatestRelease()).rejects.toThrow('Release not found');
-    });
-
-    it('should throw NetworkError on other HTTP errors', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: false,
-        status: 500,
-        statusText: 'Internal Server Error',
-        headers: new Headers(),
-      });
-
-      await expect(fetchLatestRelease()).rejects.toThrow('GitHub API error');
-    });
+    await fetchLatestRelease();
+
+    const init = mockFetch.mock.calls[0]?.[1] as RequestInit;
+    expect(init.headers).not.toHaveProperty('If-None-Match');
+  });
+
+  it('should ignore a corrupt cache file', async () => {
+    const cacheDir = mkdtempSync(join(tmpdir(), 'release-cache-'));
+    try {
+      writeFileSync(join(cacheDir, RELEASE_CACHE_FILE), 'not json');
+      mockFetch.mockResolvedValueOnce(new Response(JSON.stringify(mockRelease)));
+
+      const release = await fetchLatestRelease({ cacheDir });
+
+      expect(release.tag_name).toBe('v0.0.22');
+      // No ETag in the response, so the corrupt file is left for the next run to overwrite
+      expect(existsSync(join(cacheDir, RELEASE_CACHE_FILE))).toBe(true);
+    } finally {
+      rmSync(cacheDir, { recursive: true, force: true });
+    }
+  });
+});
+
+describe('GitHub Client findTemplateAsset', () => {
+  const release: GitHubRelease = {
+    tag_name: 'v0.0.22',
+    name: 'Release',
+    published_at: '2024-01-15T12:00:00Z',
+    html_url: 'https://github.com/github/spec-kit/releases/tag/v0.0.22',
+    assets: [
+      {
+        name: 'spec-kit-template-copilot-sh-0.0.22.zip',
+        size: 100000,
+        browser_download_url: 'https://example.com/copilot-sh.zip',
+        content_type: 'application/zip',
+      },
+      {
+        name: 'spec-kit-template-copilot-ps-0.0.22.zip',
+        size: 100001,
+        browser_download_url: 'https://example.com/copilot-ps.zip',
+        content_type: 'application/zip',
+      },
+      {
+        name: 'spec-kit-template-claude-sh-0.0.22.zip',
+        size: 100002,
+        browser_download_url: 'https://example.com/claude-sh.zip',
+        content_type: 'application/zip',
+      },
+    ],
+  };
+
+  it('should find matching asset for ai and script type', () => {
+    const asset = findTemplateAsset(release, 'copilot', 'sh');
+    
+    expect(asset).not.toBeNull();
+    expect(asset?.name).toBe('spec-kit-template-copilot-sh-0.0.22.zip');
+  });
+
+  it('should find PowerShell variant', () => {
+    const asset = findTemplateAsset(release, 'copilot', 'ps');
+    
+    expect(asset).not.toBeNull();
+    expect(asset?.name).toBe('spec-kit-template-copilot-ps-0.0.22.zip');
+  });
+
+  it('should find different AI assistant', () => {
+    const asset = findTemplateAsset(release, 'claude', 'sh');
+    
+    expect(asset).not.toBeNull();
+    expect(asset?.name).toBe('spec-kit-template-claude-sh-0.0.22.zip');
+  });
+
+  it('should return null for non-existent combination', () => {
+    const asset = findTemplateAsset(release, 'nonexistent', 'sh');
+    
+    expect(asset).toBeNull();
+  });
+
+  it('should return null for empty assets', () => {
+    const emptyRelease: GitHubRelease = {
+      ...release,
+      assets: [],
+    };
+    
+    const asset = findTemplateAsset(emptyRelease, 'copilot', 'sh');
+    
+    expect(asset).toBeNull();
   });
+});
 
-  describe('findTemplateAsset', () => {
+describe('GitHub Client getTemplateVersion', () => {
+  it('should extract version from tag with v prefix', () => {
     const release: GitHubRelease = {
       tag_name: 'v0.0.22',
       name: 'Release',
       published_at: '2024-01-15T12:00:00Z',
-      html_url: 'https://github.com/github/spec-kit/releases/tag/v0.0.22',
-      assets: [
-        {
-          name: 'spec-kit-template-copilot-sh-0.0.22.zip',
-          size: 100000,
-          browser_download_url: 'https://example.com/copilot-sh.zip',
-          content_type: 'application/zip',
-        },
-        {
-          name: 'spec-kit-template-copilot-ps-0.0.22.zip',
-          size: 100001,
-          browser_download_url: 'https://example.com/copilot-ps.zip',
-          content_type: 'application/zip',
-        },
-        {
-          name: 'spec-kit-template-claude-sh-0.0.22.zip',
-          size: 100002,
-          browser_download_url: 'https://example.com/claude-sh.zip',
-          content_type: 'application/zip',
-        },
-      ],
+      html_url: '',
+      assets: [],
     };
+    
+    expect(getTemplateVersion(release)).toBe('0.0.22');
+  });
 
-    it('should find matching asset for ai and script type', () => {
-      const asset = findTemplateAsset(release, 'copilot', 'sh');
-      
-      expect(asset).not.toBeNull();
-      expect(asset?.name).toBe('spec-kit-template-copilot-sh-0.0.22.zip');
-    });
-
-    it('should find PowerShell variant', () => {
-      const asset = findTemplateAsset(release, 'copilot', 'ps');
-      
-      expect(asset).not.toBeNull();
-      expect(asset?.name).toBe('spec-kit-template-copilot-ps-0.0.22.zip');
-    });
-
-    it('should find different AI assistant', () => {
-      const asset = findTemplateAsset(release, 'claude', 'sh');
-      
-      expect(asset).not.toBeNull();
-      expect(asset?.name).toBe('spec-kit-template-claude-sh-0.0.22.zip');
-    });
-
-    it('should return null for non-existent combination', () => {
-      const asset = findTemplateAsset(release, 'nonexistent', 'sh');
-      
-      expect(asset).toBeNull();
-    });
-
-    it('should return null for empty assets', () => {
-      const emptyRelease: GitHubRelease = {
-        ...release,
-        assets: [],
-      };
-      
-      const asset = findTemplateAsset(emptyRelease, 'copilot', 'sh');
-      
-      expect(asset).toBeNull();
-    });
+  it('should handle tag without v prefix', () => {
+    const release: GitHubRelease = {
+      tag_name: '1.0.0',
+      name: 'Release',
+      published_at: '2024-01-15T12:00:00Z',
+      html_url: '',
+      assets: [],
+    };
+    
+    expect(getTemplateVersion(release)).toBe('1.0.0');
   });
+});
 
-  describe('getTemplateVersion', () => {
-    it('should extract version from tag with v prefix', () => {
-      const release: GitHubRelease = {
-        tag_name: 'v0.0.22',
-        name: 'Release',
-        published_at: '2024-01-15T12:00:00Z',
-        html_url: '',
-        assets: [],
-      };
-      
-      expect(getTemplateVersion(release)).toBe('0.0.22');
-    });
-
-    it('should handle tag without v prefix', () => {
-      const release: GitHubRelease = {
-        tag_name: '1.0.0',
-        name: 'Release',
-        published_at: '2024-01-15T12:00:00Z',
-        html_url: '',
-        assets: [],
-      };
-      
-      expect(getTemplateVersion(release)).toBe('1.0.0');
-    });
+describe('GitHub Client formatReleaseDate', () => {
+  it('should format date as YYYY-MM-DD', () => {
+    const release: GitHubRelease = {
+      tag_name: 'v0.0.22',
+      name: 'Release',
+      published_at: '2024-01-15T12:00:00Z',
+      html_url: '',
+      assets: [],
+    };
+    
+    expect(formatReleaseDate(release)).toBe('2024-01-15');
   });
 
-  describe('formatReleaseDate', () => {
-    it('should format date as YYYY-MM-DD', () => {
-      const release: GitHubRelease = {
-        tag_name: 'v0.0.22',
-        name: 'Release',
-        published_at: '2024-01-15T12:00:00Z',
-        html_url: '',
-        assets: [],
-      };
-      
-      expect(formatReleaseDate(release)).toBe('2024-01-15');
-    });
-
-    it('should handle different date formats', () => {
-      const release: GitHubRelease = {
-        tag_name: 'v0.0.22',
-        name: 'Release',
-        published_at: '2023-12-31T23:59:59Z',
-        html_url: '',
-        assets: [],
-      };
-      
-      expect(formatReleaseDate(release)).toBe('2023-12-31');
-    });
+  it('should handle different date formats', () => {
+    const release: GitHubRelease = {
+      tag_name: 'v0.0.22',
+      name: 'Release',
+      published_at: '2023-12-31T23:59:59Z',
+      html_url: '',
+      assets: [],
+    };
+    
+    expect(formatReleaseDate(release)).toBe('2023-12-31');
   });
 });
@@ -3,110 +3,98 @@
  */
 import { describe, it, expect } from 'vitest';
 import { parseRateLimitHeaders, formatRateLimitError } from '../../../src/lib/github/rate-limit.js';
+import type { RateLimitInfo } from '../../../src/lib/github/rate-limit.js';
 
-describe('parseRateLimitHeaders', () => {
+/**
+ * Header parsing cases: [description, headers, expected fields, fields that must be absent]
+ */
+const PARSE_CASES: [string, Record<string, string>, RateLimitInfo, (keyof RateLimitInfo)[]][] = [
   // test_parses_limit_header
-  it('should parse X-RateLimit-Limit header', () => {
-    const headers = new Headers({
-      'X-RateLimit-Limit': '5000',
-    });
-    const info = parseRateLimitHeaders(headers);
-    expect(info.limit).toBe('5000');
-  });
-
+  ['X-RateLimit-Limit header', { 'X-RateLimit-Limit': '5000' }, { limit: '5000' }, ['remaining']],
   // test_parses_remaining_header
-  it('should parse X-RateLimit-Remaining header', () => {
-    const headers = new Headers({
+  ['X-RateLimit-Remaining header', { 'X-RateLimit-Remaining': '4999' }, { remaining: '4999' }, ['limit']],
+  // test_parses_reset_header: epoch seconds become a Date
+  [
+    'X-RateLimit-Reset header (epoch to Date)',
+    { 'X-RateLimit-Reset': '1700000000' },
+    { resetEpoch: 1700000000, resetTime: new Date(1700000000 * 1000) },
+    ['limit', 'remaining'],
+  ],
+  // test_parses_retry_after_header
+  ['Retry-After header (seconds)', { 'Retry-After': '120' }, { retryAfterSeconds: 120 }, ['retryAfter']],
+  // test_handles_missing_headers
+  ['missing headers', {}, {}, ['limit', 'remaining', 'resetEpoch', 'retryAfterSeconds']],
+  // test_handles_invalid_values: limit is stored as-is, an unparseable reset is dropped
+  [
+    'invalid (non-numeric) values',
+    { 'X-RateLimit-Limit': 'invalid', 'X-RateLimit-Reset': 'not-a-number' },
+    { limit: 'invalid' },
+    ['resetEpoch', 'resetTime'],
+  ],
+  // test_retry_after_formats: the seconds branch is covered above, this is the HTTP-date branch
+  [
+    'Retry-After as HTTP-date',
+    { 'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT' },
+    { retryAfter: 'Wed, 21 Oct 2015 07:28:00 GMT' },
+    ['retryAfterSeconds'],
+  ],
+  [
+    'all headers together',
+    {
+      'X-RateLimit-Limit': '5000',
       'X-RateLimit-Remaining': '4999',
-    });
-    const info = parseRateLimitHeaders(headers);
-    expect(info.remaining).toBe('4999');
-  });
-
-  // test_parses_reset_header
-  it('should parse X-RateLimit-Reset header (epoch to Date)', () => {
-    const resetEpoch = 1700000000;
-    const headers = new Headers({
-      'X-RateLimit-Reset': resetEpoch.toString(),
-    });
-    const info = parseRateLimitHeaders(headers);
-    expect(info.resetEpoch).toBe(resetEpoch);
-    expect(info.resetTime).toBeInstanceOf(Date);
-    expect(info.resetTime?.getTime()).toBe(resetEpoch * 1000);
-  });
+      'X-RateLimit-Reset': '1700000000',
+    },
+    { limit: '5000', remaining: '4999', resetEpoch: 1700000000 },
+    [],
+  ],
+];
 
-  // test_parses_retry_after_header
-  it('should parse Retry-After header (seconds)', () => {
-    const headers = new Headers({
-      'Retry-After': '120',
-    });
-    const info = parseRateLimitHeaders(headers);
-    expect(info.retryAfterSeconds).toBe(120);
-  });
+/**
+ * Response headers for the formatRateLimitError cases. formatRateLimitError
+ * only reads them, so one instance of each is shared across tests.
+ */
+const EMPTY_HEADERS = new Headers();
+const FULL_RATE_HEADERS = new Headers({
+  'X-RateLimit-Limit': '60',
+  'X-RateLimit-Remaining': '0',
+  'X-RateLimit-Reset': '1700000000',
+});
+const RETRY_AFTER_HEADERS = new Headers({ 'Retry-After': '60' });
 
-  // test_handles_missing_headers
-  it('should handle missing headers gracefully', () => {
-    const headers = new Headers();
-    const info = parseRateLimitHeaders(headers);
-    expect(info.limit).toBeUndefined();
-    expect(info.remaining).toBeUndefined();
-    expect(info.resetEpoch).toBeUndefined();
-    expect(info.retryAfterSeconds).toBeUndefined();
-  });
+const TEST_URL = 'https://api.github.com/test';
 
-  // test_handles_invalid_values
-  it('should handle invalid (non-numeric) values gracefully', () => {
-    const headers = new Headers({
-      'X-RateLimit-Limit': 'invalid',
-      'X-RateLimit-Reset': 'not-a-number',
-      'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT',
-    });
-    const info = parseRateLimitHeaders(headers);
-    // Limit is stored as-is (string)
-    expect(info.limit).toBe('invalid');
-    // Reset should not be set if invalid
-    expect(info.resetEpoch).toBeUndefined();
-    // Retry-After as HTTP-date should be stored as string
-    expect(info.retryAfter).toBe('Wed, 21 Oct 2015 07:28:00 GMT');
-    expect(info.retryAfterSeconds).toBeUndefined();
+describe('parseRateLimitHeaders', () => {
+  it.each(PARSE_CASES)('should handle %s', (_description, headers, expected, absent) => {
+    const info = parseRateLimitHeaders(new Headers(headers));
+    expect(info).toMatchObject(expected);
+    for (const key of absent) {
+      expect(info[key]).toBeUndefined();
+    }
   });
 
-  it('should parse all headers together', () => {
-    const headers = new Headers({
-      'X-RateLimit-Limit': '5000',
-      'X-RateLimit-Remaining': '4999',
-      'X-RateLimit-Reset': '1700000000',
-    });
-    const info = parseRateLimitHeaders(headers);
-    expect(info.limit).toBe('5000');
-    expect(info.remaining).toBe('4999');
-    expect(info.resetEpoch).toBe(1700000000);
+  it('should expose resetLocal as the same Date as resetTime', () => {
+    const info = parseRateLimitHeaders(new Headers({ 'X-RateLimit-Reset': '1700000000' }));
+    expect(info.resetLocal).toBe(info.resetTime);
   });
 });
 
 describe('formatRateLimitError', () => {
   // test_formats_status_code
   it('should include status code in error message', () => {
-    const headers = new Headers();
-    const message = formatRateLimitError(403, headers, 'https://api.github.com/test');
+    const message = formatRateLimitError(403, EMPTY_HEADERS, TEST_URL);
     expect(message).toContain('403');
   });
 
   // test_formats_url
   it('should include URL in error message', () => {
-    const headers = new Headers();
-    const message = formatRateLimitError(403, headers, 'https://api.github.com/test');
-    expect(message).toContain('https://api.github.com/test');
+    const message = formatRateLimitError(403, EMPTY_HEADERS, TEST_URL);
+    expect(message).toContain(TEST_URL);
   });
 
   // test_includes_rate_limit_info
   it('should include rate limit info when headers present', () => {
-    const headers = new Headers({
-      'X-RateLimit-Limit': '60',
-      'X-RateLimit-Remaining': '0',
-      'X-RateLimit-Reset': '1700000000',
-    });
-    const message = formatRateLimitError(403, headers, 'https://api.github.com/test');
+    const message = formatRateLimitError(403, FULL_RATE_HEADERS, TEST_URL);
     expect(message).toContain('Rate Limit Information');
     expect(message).toContain('60');
     expect(message).toContain('0');
@@ -115,8 +103,7 @@ describe('formatRateLimitError', () => {
 
   // test_includes_troubleshooting_tips
   it('should include troubleshooting tips', () => {
-    const headers = new Headers();
-    const message = formatRateLimitError(403, headers, 'https://api.github.com/test');
+    const message = formatRateLimitError(403, EMPTY_HEADERS, TEST_URL);
     expect(message).toContain('Troubleshooting Tips');
     expect(message).toContain('GH_TOKEN');
     expect(message).toContain('GITHUB_TOKEN');
@@ -124,17 +111,13 @@ describe('formatRateLimitError', () => {
 
   // test_mentions_5000_vs_60
   it('should mention authenticated vs unauthenticated rate limits', () => {
-    const headers = new Headers();
-    const message = formatRateLimitError(403, headers, 'https://api.github.com/test');
+    const message = formatRateLimitError(403, EMPTY_HEADERS, TEST_URL);
     expect(message).toContain('5,000');
     expect(message).toContain('60');
   });
 
   it('should include retry-after when present', () => {
-    const headers = new Headers({
-      'Retry-After': '60',
-    });
-    const message = formatRateLimitError(429, headers, 'https://api.github.com/test');
+    const message = formatRateLimitError(429, RETRY_AFTER_HEADERS, TEST_URL);
     expect(message).toContain('Retry after');
     expect(message).toContain('60 seconds');
   });
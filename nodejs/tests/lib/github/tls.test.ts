@@ -4,123 +4,98 @@
  */
 
 import { describe, it, expect } from 'vitest';
+import * as https from 'https';
+import * as tls from 'tls';
+import * as crypto from 'crypto';
 
-describe('TLS Handling', () => {
-  describe('System Certificates', () => {
-    it('should use system certificates by default', () => {
-      // Node.js uses system certificates by default through its TLS module
-      // We don't need to do anything special to use system certs
-      expect(true).toBe(true);
-    });
+describe('TLS System Certificates', () => {
+  it.todo('should use system certificates by default');
 
-    it('should support HTTPS connections', async () => {
-      // Verify that HTTPS connections work
-      // This is a basic sanity check
-      const https = await import('https');
-      expect(https).toBeDefined();
-      expect(typeof https.request).toBe('function');
-    });
+  it('should support HTTPS connections', () => {
+    // Verify that HTTPS connections work
+    // This is a basic sanity check
+    expect(https).toBeDefined();
+    expect(typeof https.request).toBe('function');
   });
+});
 
-  describe('Skip TLS Option', () => {
-    it('should support --skip-tls flag in options', () => {
-      // The skip-tls option is passed through InitOptions
-      const options = {
-        skipTls: true,
-      };
-      
-      expect(options.skipTls).toBe(true);
-    });
+describe('Skip TLS Option', () => {
+  it.todo('should support --skip-tls flag in options');
 
-    it('should default skipTls to undefined', () => {
-      const options = {};
-      
-      expect((options as Record<string, unknown>).skipTls).toBeUndefined();
-    });
-  });
+  it.todo('should default skipTls to undefined');
+});
 
-  describe('Node.js TLS Configuration', () => {
-    it('should have TLS module available', async () => {
-      const tls = await import('tls');
-      expect(tls).toBeDefined();
-    });
+describe('Node.js TLS Configuration', () => {
+  it('should have TLS module available', () => {
+    expect(tls).toBeDefined();
+  });
 
-    it('should support TLS 1.2 and above', async () => {
-      const tls = await import('tls');
-      // DEFAULT_MIN_VERSION should be TLSv1.2 or higher in modern Node.js
-      expect(tls.DEFAULT_MIN_VERSION).toBeDefined();
-    });
+  it('should support TLS 1.2 and above', () => {
+    // DEFAULT_MIN_VERSION should be TLSv1.2 or higher in modern Node.js
+    expect(tls.DEFAULT_MIN_VERSION).toBeDefined();
+  });
 
-    it('should have crypto module for secure operations', async () => {
-      const crypto = await import('crypto');
-      expect(crypto).toBeDefined();
-      expect(typeof crypto.randomBytes).toBe('function');
-    });
+  it('should have crypto module for secure operations', () => {
+    expect(crypto).toBeDefined();
+    expect(typeof crypto.randomBytes).toBe('function');
   });
+});
 
-  describe('HTTPS Agent', () => {
-    it('should support custom HTTPS agent options', async () => {
-      const https = await import('https');
-      
-      // Verify we can create an agent with custom options
-      const agent = new https.Agent({
-        rejectUnauthorized: true, // Default: verify certificates
-        keepAlive: true,
-      });
-      
-      expect(agent).toBeDefined();
-      agent.destroy();
+describe('HTTPS Agent', () => {
+  it('should support custom HTTPS agent options', () => {
+    // Verify we can create an agent with custom options
+    const agent = new https.Agent({
+      rejectUnauthorized: true, // Default: verify certificates
+      keepAlive: true,
     });
+    
+    expect(agent).toBeDefined();
+    agent.destroy();
+  });
 
-    it('should allow disabling certificate verification', async () => {
-      const https = await import('https');
-      
-      // This is what --skip-tls would do (NOT recommended for production)
-      const agent = new https.Agent({
-        rejectUnauthorized: false,
-      });
-      
-      expect(agent).toBeDefined();
-      agent.destroy();
+  it('should allow disabling certificate verification', () => {
+    // This is what --skip-tls would do (NOT recommended for production)
+    const agent = new https.Agent({
+      rejectUnauthorized: false,
     });
+    
+    expect(agent).toBeDefined();
+    agent.destroy();
   });
+});
 
-  describe('Fetch API TLS', () => {
-    it('should use native fetch for HTTPS requests', () => {
-      // Node.js 18+ has native fetch that handles TLS properly
-      expect(typeof fetch).toBe('function');
-    });
+describe('Fetch API TLS', () => {
+  it('should use native fetch for HTTPS requests', () => {
+    // Node.js 18+ has native fetch that handles TLS properly
+    expect(typeof fetch).toBe('function');
+  });
 
-    it('should support AbortController for request cancellation', () => {
-      expect(typeof AbortController).toBe('function');
-      
-      const controller = new AbortController();
-      expect(controller.signal).toBeDefined();
-    });
+  it('should support AbortController for request cancellation', () => {
+    expect(typeof AbortController).toBe('function');
+    
+    const controller = new AbortController();
+    expect(controller.signal).toBeDefined();
   });
 });
 
-describe('Certificate Handling', () => {
-  describe('Environment Variables', () => {
-    it('should support NODE_EXTRA_CA_CERTS', () => {
-      // Node.js respects NODE_EXTRA_CA_CERTS for additional CA certificates
-      const envVar = process.env.NODE_EXTRA_CA_CERTS;
-      expect(envVar === undefined || typeof envVar === 'string').toBe(true);
-    });
+describe('Certificate Environment Variables', () => {
+  it('should support NODE_EXTRA_CA_CERTS', () => {
+    // Node.js respects NODE_EXTRA_CA_CERTS for additional CA certificates
+    const envVar = process.env.NODE_EXTRA_CA_CERTS;
+    expect(envVar === undefined || typeof envVar === 'string').toBe(true);
+  });
 
-    it('should support NODE_TLS_REJECT_UNAUTHORIZED', () => {
-      // This env var can disable certificate verification (not recommended)
-      const envVar = process.env.NODE_TLS_REJECT_UNAUTHORIZED;
-      expect(envVar === undefined || typeof envVar === 'string').toBe(true);
-    });
+  it('should support NODE_TLS_REJECT_UNAUTHORIZED', () => {
+    // This env var can disable certificate verification (not recommended)
+    const envVar = process.env.NODE_TLS_REJECT_UNAUTHORIZED;
+    expect(envVar === undefined || typeof envVar === 'string').toBe(true);
   });
+});
 
-  describe('Root Certificates', () => {
-    it('should have access to root certificates', async () => {
-      const tls = await import('tls');
-      // rootCertificates is available in Node.js 12.3.0+
-      expect(Array.isArray(tls.rootCertificates)).toBe(true);
-      expect(tls.rootCertificates.length).toBeGreaterThan(0);
-    });
+describe('Certificate Root Certificates', () => {
+  it('should have access to root certificates', () => {
+    // rootCertificates is available in Node.js 12.3.0+
+    expect(Array.isArray(tls.rootCertificates)).toBe(true);
+    expect(tls.rootCertificates.length).toBeGreaterThan(0);
   });
 });
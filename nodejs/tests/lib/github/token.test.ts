@@ -1,45 +1,44 @@
 /**
  * GitHub token tests - ported from test_github_token.py
  */
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { getGitHubToken, getAuthHeaders } from '../../../src/lib/github/token.js';
+import { clearEnv } from '../../setup.js';
 
 describe('getGitHubToken', () => {
-  let originalEnv: NodeJS.ProcessEnv;
-
   beforeEach(() => {
-    // Save original environment
-    originalEnv = { ...process.env };
-    // Clear relevant env vars
-    delete process.env.GH_TOKEN;
-    delete process.env.GITHUB_TOKEN;
-  });
-
-  afterEach(() => {
-    // Restore original environment
-    process.env = originalEnv;
+    // Blank out host tokens; stubs are undone after each test
+    clearEnv();
   });
 
   // test_cli_token_takes_precedence
   it('should prefer CLI token over environment variables', () => {
-    process.env.GH_TOKEN = 'env_gh_token';
-    process.env.GITHUB_TOKEN = 'env_github_token';
+    vi.stubEnv('GH_TOKEN', 'env_gh_token');
+    vi.stubEnv('GITHUB_TOKEN', 'env_github_token');
     expect(getGitHubToken('cli_token')).toBe('cli_token');
   });
 
   // test_gh_token_fallback
   it('should fall back to GH_TOKEN when no CLI arg', () => {
-    process.env.GH_TOKEN = 'env_gh_token';
-    process.env.GITHUB_TOKEN = 'env_github_token';
+    vi.stubEnv('GH_TOKEN', 'env_gh_token');
+    vi.stubEnv('GITHUB_TOKEN', 'env_github_token');
     expect(getGitHubToken()).toBe('env_gh_token');
   });
 
   // test_github_token_fallback
   it('should fall back to GITHUB_TOKEN when no GH_TOKEN', () => {
-    process.env.GITHUB_TOKEN = 'env_github_token';
+    vi.stubEnv('GITHUB_TOKEN', 'env_github_token');
     expect(getGitHubToken()).toBe('env_github_token');
   });
 
+  // test_env_var_precedence_all_set
+  it('should resolve CLI > GH_TOKEN > GITHUB_TOKEN when all are set', () => {
+    vi.stubEnv('GH_TOKEN', 'gh_token');
+    vi.stubEnv('GITHUB_TOKEN', 'github_token');
+    expect(getGitHubToken('cli_token')).toBe('cli_token');
+    expect(getGitHubToken()).toBe('gh_token');
+  });
+
   // test_no_token_returns_undefined
   it('should return undefined when no token is available', () => {
     expect(getGitHubToken()).toBeUndefined();
@@ -52,7 +51,7 @@ describe('getGitHubToken', () => {
 
   // test_trims_whitespace_env
   it('should trim whitespace from env token', () => {
-    process.env.GH_TOKEN = '  env_token_spaces  ';
+    vi.stubEnv('GH_TOKEN', '  env_token_spaces  ');
     expect(getGitHubToken()).toBe('env_token_spaces');
   });
 
@@ -68,6 +67,11 @@ describe('getGitHubToken', () => {
     expect(getGitHubToken('')).toBeUndefined();
   });
 
+  it('should not fall back to env when the CLI token is whitespace-only', () => {
+    vi.stubEnv('GH_TOKEN', 'env_gh_token');
+    expect(getGitHubToken('   ')).toBeUndefined();
+  });
+
   // test_whitespace_only_undefined
   it('should return undefined for whitespace-only string', () => {
     expect(getGitHubToken('   ')).toBeUndefined();
@@ -76,16 +80,8 @@ describe('getGitHubToken', () => {
 });
 
 describe('getAuthHeaders', () => {
-  let originalEnv: NodeJS.ProcessEnv;
-
   beforeEach(() => {
-    originalEnv = { ...process.env };
-    delete process.env.GH_TOKEN;
-    delete process.env.GITHUB_TOKEN;
-  });
-
-  afterEach(() => {
-    process.env = originalEnv;
+    clearEnv();
   });
 
   // test_auth_headers_empty_no_token
@@ -102,9 +98,16 @@ describe('getAuthHeaders', () => {
 
   // test_auth_headers_cli_precedence
   it('should use CLI token over env in headers', () => {
-    process.env.GH_TOKEN = 'env_token';
+    vi.stubEnv('GH_TOKEN', 'env_token');
     expect(getAuthHeaders('cli_token')).toEqual({
       Authorization: 'Bearer cli_token',
     });
   });
+
+  it('should reuse one frozen headers object per token', () => {
+    const first = getAuthHeaders('my_token');
+    expect(getAuthHeaders('my_token')).toBe(first);
+    expect(Object.isFrozen(first)).toBe(true);
+    expect(getAuthHeaders('other_token')).not.toBe(first);
+  });
 });
@@ -3,20 +3,44 @@
  * Ported from tests/acceptance/test_template_download.py
  */
 
-import { describe, it, expect } from 'vitest';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { existsSync, mkdtempSync, readFileSync, rmSync } from 'fs';
+import { join } from 'path';
+import { tmpdir } from 'os';
+import { randomBytes } from 'crypto';
 import {
   REPO_OWNER,
   REPO_NAME,
   API_URL,
+  API_HEADERS,
   API_TIMEOUT,
   STREAM_TIMEOUT,
   CHUNK_SIZE,
+  downloadTemplate,
   getAssetNamePattern,
   isValidAssetName,
   findMatchingAsset,
   getAvailableAssets,
   type GitHubRelease,
 } from '../../../src/lib/template/download.js';
+import { clearEnv } from '../../setup.js';
+
+/**
+ * Latest release with templates for several agents. The claude-code asset
+ * sits ahead of claude's so a loose pattern would pick it first.
+ */
+const RELEASE: GitHubRelease = {
+  tag_name: 'v0.0.22',
+  name: 'Release 0.0.22',
+  published_at: '2024-01-01T00:00:00Z',
+  assets: [
+    { name: 'spec-kit-template-copilot-0.0.22.zip', size: 1000, browser_download_url: 'https://example.com/1' },
+    { name: 'spec-kit-template-claude-code-0.0.22.zip', size: 1500, browser_download_url: 'https://example.com/near-miss' },
+    { name: 'spec-kit-template-claude-0.0.22.zip', size: 2000, browser_download_url: 'https://example.com/2' },
+    { name: 'spec-kit-template-cursor-agent-v0.0.22.zip', size: 3000, browser_download_url: 'https://example.com/3' },
+    { name: 'spec-kit-template-gemini-0.0.22.zip', size: 4000, browser_download_url: 'https://example.com/4' },
+  ],
+};
 
 describe('Template Download API', () => {
   it('uses correct GitHub API URL format', () => {
@@ -38,6 +62,14 @@ describe('Template Download API', () => {
   it('streaming download timeout is 60 seconds', () => {
     expect(STREAM_TIMEOUT).toBe(60);
   });
+
+  it('shares one frozen set of API headers', () => {
+    expect(API_HEADERS).toEqual({
+      Accept: 'application/vnd.github+json',
+      'User-Agent': 'speckit-cli',
+    });
+    expect(Object.isFrozen(API_HEADERS)).toBe(true);
+  });
 });
 
 describe('Asset Name Pattern', () => {
@@ -61,18 +93,19 @@ describe('Asset Name Pattern', () => {
     }
   });
 
-  it('finds matching asset for ai_assistant', () => {
-    const release: GitHubRelease = {
-      tag_name: 'v0.0.22',
-      name: 'Release 0.0.22',
-      published_at: '2024-01-01T00:00:00Z',
-      assets: [
-        { name: 'spec-kit-template-copilot-0.0.22.zip', size: 1000, browser_download_url: 'https://example.com/1' },
-        { name: 'spec-kit-template-claude-0.0.22.zip', size: 2000, browser_download_url: 'https://example.com/2' },
-      ],
-    };
+  // test_all_agents_have_valid_asset_names
+  it.each([
+    ['copilot', 'spec-kit-template-copilot-0.0.22.zip'],
+    ['claude', 'spec-kit-template-claude-0.0.22.zip'],
+    ['cursor-agent', 'spec-kit-template-cursor-agent-v0.0.22.zip'],
+    ['gemini', 'spec-kit-template-gemini-0.0.22.zip'],
+  ])('picks the %s asset from the release', (ai, expected) => {
+    expect(findMatchingAsset(RELEASE, ai)?.name).toBe(expected);
+    expect(RELEASE.assets.filter(asset => getAssetNamePattern(ai).test(asset.name))).toHaveLength(1);
+  });
 
-    const asset = findMatchingAsset(release, 'copilot');
+  it('finds matching asset for ai_assistant', () => {
+    const asset = findMatchingAsset(RELEASE, 'copilot');
     expect(asset).not.toBeNull();
     expect(asset?.name).toBe('spec-kit-template-copilot-0.0.22.zip');
   });
@@ -139,6 +172,59 @@ describe('Download Progress', () => {
   });
 });
 
+describe('Download Template Streaming', () => {
+  let tempDir: string;
+
+  beforeEach(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'download-test-'));
+  });
+
+  afterEach(() => {
+    rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('streams the asset body to the zip path', async () => {
+    // No ambient token, so the asset request carries only the base headers
+    clearEnv();
+    const assetName = 'spec-kit-template-claude-0.0.22.zip';
+    const payload = randomBytes(3 * 1024 * 1024);
+    const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(new Response(JSON.stringify(RELEASE)))
+      .mockResolvedValueOnce(new Response(payload));
+
+    const result = await downloadTemplate('claude', join(tempDir, 'out'), {
+      cacheDir: join(tempDir, 'cache'),
+    });
+
+    expect(result.zipPath).toBe(join(tempDir, 'out', assetName));
+    expect(fetchSpy).toHaveBeenLastCalledWith('https://example.com/2', {
+      headers: { 'User-Agent': 'speckit-cli', Accept: 'application/octet-stream' },
+    });
+    expect(readFileSync(result.zipPath).equals(payload)).toBe(true);
+  });
+
+  it('removes the partial zip when the body stream fails', async () => {
+    const assetName = 'spec-kit-template-claude-0.0.22.zip';
+    // Deliver half the payload, then fail as a dropped connection would
+    const body = new ReadableStream<Uint8Array>({
+      start(controller) {
+        controller.enqueue(new Uint8Array(1024));
+      },
+      pull(controller) {
+        controller.error(new Error('connection reset'));
+      },
+    });
+    vi.spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(new Response(JSON.stringify(RELEASE)))
+      .mockResolvedValueOnce(new Response(body));
+
+    await expect(
+      downloadTemplate('claude', join(tempDir, 'out'), { cacheDir: join(tempDir, 'cache') })
+    ).rejects.toThrow('connection reset');
+    expect(existsSync(join(tempDir, 'out', assetName))).toBe(false);
+  });
+});
+
 describe('Asset Validation', () => {
   it('validates valid asset names', () => {
     expect(isValidAssetName('spec-kit-template-copilot-0.0.22.zip')).toBe(true);
@@ -4,7 +4,7 @@
  */
 
 import { describe, it, expect } from 'vitest';
-import { mkdirSync, writeFileSync, rmSync, existsSync, readdirSync } from 'node:fs';
+import { mkdirSync, mkdtempSync, writeFileSync, rmSync, existsSync, readdirSync } from 'node:fs';
 import { join } from 'node:path';
 import { tmpdir } from 'node:os';
 import {
@@ -15,16 +15,12 @@ import {
 
 // Helper to create temp directory
 function createTempDir(): string {
-  const dir = join(tmpdir(), `specify-test-${Date.now()}-${Math.random().toString(36).slice(2)}`);
-  mkdirSync(dir, { recursive: true });
-  return dir;
+  return mkdtempSync(join(tmpdir(), 'specify-test-'));
 }
 
 // Helper to clean up temp directory
 function cleanupTempDir(dir: string): void {
-  if (existsSync(dir)) {
-    rmSync(dir, { recursive: true });
-  }
+  rmSync(dir, { recursive: true, force: true });
 }
 
 describe('Extract Basic Behavior', () => {
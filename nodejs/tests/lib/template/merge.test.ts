@@ -1,11 +1,28 @@
 /**
  * JSON merge tests - ported from test_json_merge.py
  */
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
-import { writeFileSync, mkdirSync, rmSync } from 'fs';
+import { describe, it, expect, beforeAll, afterAll, beforeEach, afterEach } from 'vitest';
+import {
+  writeFileSync,
+  mkdtempSync,
+  mkdirSync,
+  rmSync,
+  readFileSync,
+  readdirSync,
+  symlinkSync,
+  lstatSync,
+  statSync,
+  chmodSync,
+} from 'fs';
 import { join } from 'path';
 import { tmpdir } from 'os';
-import { deepMerge, mergeJsonFiles } from '../../../src/lib/template/merge.js';
+import { deepMerge, mergeJsonFiles, writeJsonFile } from '../../../src/lib/template/merge.js';
+import { IS_WINDOWS } from '../../setup.js';
+
+/** Deeply nested fixture for the file merge test, serialized once */
+const DEEP_BASE = { a: { b: { c: { d: { e: 'existing' } } } } };
+const DEEP_BASE_JSON = JSON.stringify(DEEP_BASE);
+const DEEP_UPDATE = { a: { b: { c: { d: { f: 'new' } } } } };
 
 describe('deepMerge', () => {
   // test_deep_merge_returns_object
@@ -151,19 +168,23 @@ describe('deepMerge', () => {
 });
 
 describe('mergeJsonFiles', () => {
+  // One directory for the whole describe; each test gets its own file in it
   let tempDir: string;
   let testFilePath: string;
+  let fileIndex = 0;
 
-  beforeEach(() => {
-    tempDir = join(tmpdir(), `merge-test-${Date.now()}`);
-    mkdirSync(tempDir, { recursive: true });
-    testFilePath = join(tempDir, 'test.json');
+  beforeAll(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'merge-test-'));
   });
 
-  afterEach(() => {
+  afterAll(() => {
     rmSync(tempDir, { recursive: true, force: true });
   });
 
+  beforeEach(() => {
+    testFilePath = join(tempDir, `test-${++fileIndex}.json`);
+  });
+
   // test_nonexistent_file_returns_update
   it('should return update when file does not exist', () => {
     const newContent = { a: 1, b: 2 };
@@ -171,6 +192,11 @@ describe('mergeJsonFiles', () => {
     expect(result).toEqual(newContent);
   });
 
+  it('should return update when path is a directory', () => {
+    const newContent = { a: 1 };
+    expect(mergeJsonFiles(tempDir, newContent)).toEqual(newContent);
+  });
+
   // test_invalid_json_returns_update
   it('should return update when file has invalid JSON', () => {
     writeFileSync(testFilePath, 'not valid json {{{');
@@ -192,4 +218,96 @@ describe('mergeJsonFiles', () => {
     const result = mergeJsonFiles(testFilePath, newContent);
     expect(result).toEqual({ nested: { a: 1, b: 2 } });
   });
+
+  it('should not mutate the new content', () => {
+    writeFileSync(testFilePath, JSON.stringify({ nested: { a: 1 } }));
+    const newContent = { nested: { b: 2 } };
+    mergeJsonFiles(testFilePath, newContent);
+    expect(newContent).toEqual({ nested: { b: 2 } });
+  });
+
+  it('should return update when file is not a JSON object', () => {
+    writeFileSync(testFilePath, JSON.stringify([1, 2, 3]));
+    const newContent = { a: 1 };
+    expect(mergeJsonFiles(testFilePath, newContent)).toEqual(newContent);
+  });
+
+  it('should add a whole new subtree from the update', () => {
+    writeFileSync(testFilePath, JSON.stringify({ existing: true }));
+    const newContent = { added: { nested: { deep: [1, 2] } } };
+    const result = mergeJsonFiles(testFilePath, newContent);
+    expect(result).toEqual({ existing: true, added: { nested: { deep: [1, 2] } } });
+  });
+
+  it('should keep file content when update is empty', () => {
+    writeFileSync(testFilePath, JSON.stringify({ nested: { a: 1 } }));
+    expect(mergeJsonFiles(testFilePath, {})).toEqual({ nested: { a: 1 } });
+  });
+
+  it('should take the update when file holds an empty object', () => {
+    writeFileSync(testFilePath, '{}');
+    const newContent = { nested: { b: 2 } };
+    expect(mergeJsonFiles(testFilePath, newContent)).toEqual(newContent);
+  });
+
+  // test_merge_deeply_nested
+  it('should merge deeply nested content from file', () => {
+    writeFileSync(testFilePath, DEEP_BASE_JSON);
+    const result = mergeJsonFiles(testFilePath, DEEP_UPDATE);
+    expect(result).toEqual({ a: { b: { c: { d: { e: 'existing', f: 'new' } } } } });
+  });
+});
+
+describe('writeJsonFile', () => {
+  let tempDir: string;
+
+  beforeEach(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'write-json-test-'));
+  });
+
+  afterEach(() => {
+    rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('should replace the file with indented JSON and a trailing newline', () => {
+    const filePath = join(tempDir, 'settings.json');
+    writeFileSync(filePath, '{"old": true}');
+    writeJsonFile(filePath, { a: { b: 1 } });
+    expect(readFileSync(filePath, 'utf-8')).toBe('{\n  "a": {\n    "b": 1\n  }\n}\n');
+  });
+
+  it('should not leave a temp file behind', () => {
+    writeJsonFile(join(tempDir, 'settings.json'), { a: 1 });
+    expect(readdirSync(tempDir)).toEqual(['settings.json']);
+  });
+
+  it('should clean up and rethrow when the rename fails', () => {
+    // A directory in place of the target makes the rename itself fail
+    mkdirSync(join(tempDir, 'settings.json'));
+    expect(() => writeJsonFile(join(tempDir, 'settings.json'), {})).toThrow();
+    expect(readdirSync(tempDir)).toEqual(['settings.json']);
+  });
+
+  it.skipIf(IS_WINDOWS)('should write through a symlinked target', () => {
+    const realPath = join(tempDir, 'real.json');
+    const linkPath = join(tempDir, 'settings.json');
+    writeFileSync(realPath, '{}');
+    symlinkSync(realPath, linkPath);
+
+    writeJsonFile(linkPath, { a: 1 });
+
+    expect(lstatSync(linkPath).isSymbolicLink()).toBe(true);
+    expect(JSON.parse(readFileSync(realPath, 'utf-8'))).toEqual({ a: 1 });
+    expect(readdirSync(tempDir).sort()).toEqual(['real.json', 'settings.json']);
+  });
+
+  it.skipIf(IS_WINDOWS)('should keep the mode of an existing file', () => {
+    const filePath = join(tempDir, 'settings.json');
+    writeFileSync(filePath, '{}');
+    chmodSync(filePath, 0o600);
+
+    writeJsonFile(filePath, { a: 1 });
+
+    expect(statSync(filePath).mode & 0o777).toBe(0o600);
+  });
 });
@@ -1,9 +1,10 @@
 /**
  * Tool detection tests - ported from test_tool_detection.py
  */
-import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, vi } from 'vitest';
 import { execSync } from 'child_process';
 import { existsSync, statSync } from 'fs';
+import { CLAUDE_LOCAL_PATH } from '../../../src/lib/config.js';
 import { checkTool } from '../../../src/lib/tools/detect.js';
 import { StepTracker } from '../../../src/lib/ui/tracker.js';
 
@@ -17,11 +18,16 @@ vi.mock('fs', () => ({
   statSync: vi.fn(),
 }));
 
-describe('checkTool', () => {
-  beforeEach(() => {
-    vi.clearAllMocks();
-  });
+/** Shared fake stat results, built once instead of per test */
+const FILE_STAT = { isFile: () => true } as ReturnType<typeof statSync>;
+const DIR_STAT = { isFile: () => false } as ReturnType<typeof statSync>;
 
+/** Stand-in for `which`/`where` failing to find a tool */
+function toolNotFound(): never {
+  throw new Error('not found');
+}
+
+describe('checkTool', () => {
   // test_detects_git (we'll simulate it being found)
   it('should detect installed tools', () => {
     vi.mocked(execSync).mockReturnValue(Buffer.from('/usr/bin/git'));
@@ -36,9 +42,7 @@ describe('checkTool', () => {
 
   // test_nonexistent_tool_returns_false
   it('should return false for non-existent tools', () => {
-    vi.mocked(execSync).mockImplementation(() => {
-      throw new Error('not found');
-    });
+    vi.mocked(execSync).mockImplementation(toolNotFound);
     expect(checkTool('fake-tool-that-does-not-exist')).toBe(false);
   });
 
@@ -46,9 +50,10 @@ describe('checkTool', () => {
   it('should check Claude special path first', () => {
     // Mock Claude local path exists
     vi.mocked(existsSync).mockReturnValue(true);
-    vi.mocked(statSync).mockReturnValue({ isFile: () => true } as ReturnType<typeof statSync>);
+    vi.mocked(statSync).mockReturnValue(FILE_STAT);
 
     expect(checkTool('claude')).toBe(true);
+    expect(existsSync).toHaveBeenCalledWith(CLAUDE_LOCAL_PATH);
 
     // execSync should not be called since special path exists
     expect(execSync).not.toHaveBeenCalled();
@@ -68,9 +73,7 @@ describe('checkTool', () => {
 
   // test_tracker_updated_on_not_found
   it('should update tracker with error when tool not found', () => {
-    vi.mocked(execSync).mockImplementation(() => {
-      throw new Error('not found');
-    });
+    vi.mocked(execSync).mockImplementation(toolNotFound);
     const tracker = new StepTracker('Test');
     tracker.add('fake', 'Fake Tool');
 
@@ -90,10 +93,20 @@ describe('checkTool', () => {
 
   it('should fall back to PATH when Claude special path is not a file', () => {
     vi.mocked(existsSync).mockReturnValue(true);
-    vi.mocked(statSync).mockReturnValue({ isFile: () => false } as ReturnType<typeof statSync>);
+    vi.mocked(statSync).mockReturnValue(DIR_STAT);
     vi.mocked(execSync).mockReturnValue(Buffer.from('/usr/bin/claude'));
 
     expect(checkTool('claude')).toBe(true);
     expect(execSync).toHaveBeenCalled();
   });
+
+  // test_claude_local_path_edge_cases
+  it('should return false when Claude special path is not a file and not on PATH', () => {
+    vi.mocked(existsSync).mockReturnValue(true);
+    vi.mocked(statSync).mockReturnValue(DIR_STAT);
+    vi.mocked(execSync).mockImplementation(toolNotFound);
+
+    expect(checkTool('claude')).toBe(false);
+    expect(statSync).toHaveBeenCalledWith(CLAUDE_LOCAL_PATH);
+  });
 });
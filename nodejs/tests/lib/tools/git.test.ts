@@ -1,36 +1,57 @@
 /**
  * Git operations tests - ported from test_git_operations.py
  */
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
-import { mkdirSync, rmSync, writeFileSync } from 'fs';
-import { join } from 'path';
+import { describe, it, expect, vi, beforeAll, afterAll, beforeEach, afterEach } from 'vitest';
+import { mkdirSync, mkdtempSync, readFileSync, rmSync, writeFileSync } from 'fs';
+import { dirname, join } from 'path';
 import { tmpdir } from 'os';
-import { execSync } from 'child_process';
+import { execFileSync } from 'child_process';
 import { isGitRepo, initGitRepo } from '../../../src/lib/tools/git.js';
+import type { GitInitResult } from '../../../src/lib/tools/git.js';
+import { gitOnPath } from '../../setup.js';
+
+/**
+ * Multi-file project committed by initGitRepo, keyed by the path git reports
+ */
+const PROJECT_FILES: Record<string, string> = {
+  'README.md': '# Test Project\n',
+  'file1.txt': 'one',
+  'subdir/file2.txt': 'two',
+};
 
 describe('isGitRepo', () => {
+  // The tests only read this layout, so it is built once for the describe
   let tempDir: string;
   let gitDir: string;
   let nonGitDir: string;
 
-  beforeEach(() => {
-    tempDir = join(tmpdir(), `git-test-${Date.now()}`);
+  beforeAll(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'git-test-'));
     gitDir = join(tempDir, 'git-repo');
     nonGitDir = join(tempDir, 'non-git');
 
-    mkdirSync(gitDir, { recursive: true });
     mkdirSync(nonGitDir, { recursive: true });
 
-    // Initialize git repo
-    execSync('git init', { cwd: gitDir, stdio: 'ignore' });
-    execSync('git config user.email "test@test.com"', { cwd: gitDir, stdio: 'ignore' });
-    execSync('git config user.name "Test"', { cwd: gitDir, stdio: 'ignore' });
+    // Minimal repository layout, enough for git rev-parse as well as the
+    // .git lookup, without spawning git init
+    mkdirSync(join(gitDir, '.git', 'objects'), { recursive: true });
+    mkdirSync(join(gitDir, '.git', 'refs'));
+    writeFileSync(join(gitDir, '.git', 'HEAD'), 'ref: refs/heads/main\n');
+
+    mkdirSync(join(gitDir, 'src', 'lib'), { recursive: true });
+    writeFileSync(join(gitDir, 'README.md'), '# Test\n');
   });
 
-  afterEach(() => {
+  afterAll(() => {
     rmSync(tempDir, { recursive: true, force: true });
   });
 
+  beforeEach(() => {
+    // Keep isGitRepo on the .git lookup; a GIT_DIR from the host would
+    // send every case through git rev-parse
+    vi.stubEnv('GIT_DIR', '');
+  });
+
   // test_is_git_repo_true
   it('should return true for git repository', () => {
     expect(isGitRepo(gitDir)).toBe(true);
@@ -44,48 +65,101 @@ describe('isGitRepo', () => {
   it('should return false for non-existent path', () => {
     expect(isGitRepo(join(tempDir, 'does-not-exist'))).toBe(false);
   });
+
+  it('should detect a .git directory in a parent', () => {
+    expect(isGitRepo(join(gitDir, 'src', 'lib'))).toBe(true);
+  });
+
+  it('should return false for a file path', () => {
+    expect(isGitRepo(join(gitDir, 'README.md'))).toBe(false);
+  });
 });
 
-describe('initGitRepo', () => {
+describe.runIf(gitOnPath())('initGitRepo on a project', () => {
+  // One init for the whole describe; the tests only inspect its outcome
   let tempDir: string;
   let projectDir: string;
+  let result: GitInitResult;
+  let commitMessage: string;
+  let files: string[];
 
-  beforeEach(() => {
-    tempDir = join(tmpdir(), `git-init-test-${Date.now()}`);
+  beforeAll(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'git-init-test-'));
     projectDir = join(tempDir, 'project');
 
-    mkdirSync(projectDir, { recursive: true });
-
-    // Create a test file
-    writeFileSync(join(projectDir, 'README.md'), '# Test Project\n');
+    for (const [relPath, content] of Object.entries(PROJECT_FILES)) {
+      const filePath = join(projectDir, relPath);
+      mkdirSync(dirname(filePath), { recursive: true });
+      writeFileSync(filePath, content);
+    }
+
+    result = initGitRepo(projectDir, true);
+
+    // git commit leaves the message behind in COMMIT_EDITMSG; listing the
+    // HEAD tree is the one git process, and it fails if no commit was made.
+    // Both fall back to empty so the assertions report result.error instead
+    // of the hook failing every test
+    try {
+      commitMessage = readFileSync(join(projectDir, '.git', 'COMMIT_EDITMSG'), 'utf-8');
+    } catch {
+      commitMessage = '';
+    }
+    try {
+      files = execFileSync('git', ['ls-tree', '-r', '--name-only', '-z', 'HEAD'], {
+        cwd: projectDir,
+        encoding: 'utf-8',
+        stdio: ['pipe', 'pipe', 'ignore'],
+      })
+        .split('\0')
+        .filter(Boolean);
+    } catch {
+      files = [];
+    }
   });
 
-  afterEach(() => {
+  afterAll(() => {
     rmSync(tempDir, { recursive: true, force: true });
   });
 
   // test_init_git_repo_creates_repo
   it('should create a git repository', () => {
-    const result = initGitRepo(projectDir, true);
     expect(result.success).toBe(true);
     expect(isGitRepo(projectDir)).toBe(true);
   });
 
   // test_init_git_repo_commits
   it('should make initial commit', () => {
-    initGitRepo(projectDir, true);
+    expect(files).not.toHaveLength(0);
+    expect(commitMessage).toContain('Initial commit from Speckit template');
+  });
+
+  // test_commit_message
+  it('should use the template commit message', () => {
+    expect(commitMessage.trim()).toBe('Initial commit from Speckit template');
+  });
 
-    // Check that a commit was made
-    const log = execSync('git log --oneline', { cwd: projectDir, encoding: 'utf-8' });
-    expect(log).toContain('Initial commit from Speckit template');
+  // test_stages_all_files
+  it('should commit all files', () => {
+    expect(files.sort()).toEqual(Object.keys(PROJECT_FILES).sort());
   });
 
   // test_init_git_repo_returns_success
   it('should return success tuple on success', () => {
-    const result = initGitRepo(projectDir, true);
     expect(result.success).toBe(true);
     expect(result.error).toBeNull();
   });
+});
+
+describe.runIf(gitOnPath())('initGitRepo', () => {
+  let tempDir: string;
+
+  beforeEach(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'git-init-test-'));
+  });
+
+  afterEach(() => {
+    rmSync(tempDir, { recursive: true, force: true });
+  });
 
   // test_init_git_repo_returns_error
   it('should return error tuple on failure', () => {
@@ -95,4 +169,14 @@ describe('initGitRepo', () => {
     expect(result.success).toBe(false);
     expect(result.error).not.toBeNull();
   });
+
+  // test_init_git_repo_empty_dir
+  it('should fail the initial commit for an empty directory', () => {
+    const emptyDir = join(tempDir, 'empty');
+    mkdirSync(emptyDir);
+    // git init succeeds, but there is nothing to commit
+    const result = initGitRepo(emptyDir, true);
+    expect(result.success).toBe(false);
+    expect(result.error).toContain('git commit');
+  });
 });
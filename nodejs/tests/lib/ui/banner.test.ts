@@ -4,40 +4,51 @@
 import { describe, it, expect, vi } from 'vitest';
 import { showBanner, getBannerText, getTagline } from '../../../src/lib/ui/banner.js';
 
+const BANNER_TEXT = getBannerText();
+const BANNER_LINES = BANNER_TEXT.split('\n');
+
+/**
+ * Exact expected banner art (trailing spaces are significant)
+ */
+const EXPECTED_BANNER_LINES = [
+  '███████╗██████╗ ███████╗ ██████╗██╗███████╗██╗   ██╗',
+  '██╔════╝██╔══██╗██╔════╝██╔════╝██║██╔════╝╚██╗ ██╔╝',
+  '███████╗██████╔╝█████╗  ██║     ██║█████╗   ╚████╔╝ ',
+  '╚════██║██╔═══╝ ██╔══╝  ██║     ██║██╔══╝    ╚██╔╝  ',
+  '███████║██║     ███████╗╚██████╗██║██║        ██║   ',
+  '╚══════╝╚═╝     ╚══════╝ ╚═════╝╚═╝╚═╝        ╚═╝',
+];
+
 describe('BANNER', () => {
   // test_banner_has_6_lines
   it('should have 6 lines', () => {
-    const bannerText = getBannerText();
-    const lines = bannerText.split('\n');
-    expect(lines).toHaveLength(6);
+    expect(BANNER_LINES).toHaveLength(6);
+  });
+
+  // test_banner_exact_lines
+  it('should match the expected banner exactly', () => {
+    expect(BANNER_LINES).toEqual(EXPECTED_BANNER_LINES);
   });
 
   // test_banner_contains_specify_text (ASCII art version)
   it('should spell out SPECIFY in ASCII art', () => {
-    const bannerText = getBannerText();
     // The banner uses Unicode box-drawing characters
-    expect(bannerText).toContain('███████'); // Part of the S
-    expect(bannerText).toContain('██████╗'); // Part of the P
+    expect(BANNER_TEXT).toContain('███████'); // Part of the S
+    expect(BANNER_TEXT).toContain('██████╗'); // Part of the P
   });
 
   it('should use Unicode block characters', () => {
-    const bannerText = getBannerText();
-    expect(bannerText).toContain('█');
-    expect(bannerText).toContain('╗');
-    expect(bannerText).toContain('║');
+    expect(BANNER_TEXT).toContain('█');
+    expect(BANNER_TEXT).toContain('╗');
+    expect(BANNER_TEXT).toContain('║');
   });
 
   it('should have exact first line pattern', () => {
-    const bannerText = getBannerText();
-    const firstLine = bannerText.split('\n')[0];
-    expect(firstLine).toContain('███████╗██████╗');
+    expect(BANNER_LINES[0]).toContain('███████╗██████╗');
   });
 
   it('should have exact last line pattern', () => {
-    const bannerText = getBannerText();
-    const lines = bannerText.split('\n');
-    const lastLine = lines[lines.length - 1];
-    expect(lastLine).toContain('╚══════╝╚═╝');
+    expect(BANNER_LINES[BANNER_LINES.length - 1]).toContain('╚══════╝╚═╝');
   });
 });
 
@@ -1,25 +1,36 @@
 /**
  * Step tracker tests - ported from test_step_tracker.py
  */
-import { describe, it, expect, vi } from 'vitest';
-import { StepTracker } from '../../../src/lib/ui/tracker.js';
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { StepTracker, STATUS_ORDER } from '../../../src/lib/ui/tracker.js';
+
+/**
+ * Refresh callback that always fails
+ */
+function throwingRefresh(): never {
+  throw new Error('Callback error');
+}
+
+// Fresh tracker per test so steps and callbacks never leak between tests
+let tracker: StepTracker;
+
+beforeEach(() => {
+  tracker = new StepTracker('Title');
+});
 
 describe('StepTracker initialization', () => {
   // test_init_accepts_title
   it('should accept and store title', () => {
-    const tracker = new StepTracker('My Title');
-    expect(tracker.title).toBe('My Title');
+    expect(new StepTracker('My Title').title).toBe('My Title');
   });
 
   // test_init_steps_empty
   it('should start with empty steps array', () => {
-    const tracker = new StepTracker('Title');
     expect(tracker.steps).toEqual([]);
   });
 
   // test_status_order_defined
   it('should have 5 status values defined', () => {
-    const tracker = new StepTracker('Title');
     expect(Object.keys(tracker.statusOrder)).toHaveLength(5);
     expect(tracker.statusOrder).toHaveProperty('pending');
     expect(tracker.statusOrder).toHaveProperty('running');
@@ -27,12 +38,19 @@ describe('StepTracker initialization', () => {
     expect(tracker.statusOrder).toHaveProperty('error');
     expect(tracker.statusOrder).toHaveProperty('skipped');
   });
+
+  it('should share one frozen status order across trackers', () => {
+    const first = new StepTracker('First');
+    const second = new StepTracker('Second');
+    expect(first.statusOrder).toBe(STATUS_ORDER);
+    expect(second.statusOrder).toBe(STATUS_ORDER);
+    expect(Object.isFrozen(STATUS_ORDER)).toBe(true);
+  });
 });
 
 describe('StepTracker.add', () => {
   // test_add_creates_step
   it('should create step with correct structure', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     expect(tracker.steps).toHaveLength(1);
     expect(tracker.steps[0]).toEqual({
@@ -45,7 +63,6 @@ describe('StepTracker.add', () => {
 
   // test_add_same_key_noop
   it('should not add duplicate keys', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.add('step1', 'Different Label');
     expect(tracker.steps).toHaveLength(1);
@@ -54,7 +71,6 @@ describe('StepTracker.add', () => {
 
   // test_add_maintains_order
   it('should maintain insertion order', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('first', 'First');
     tracker.add('second', 'Second');
     tracker.add('third', 'Third');
@@ -65,7 +81,6 @@ describe('StepTracker.add', () => {
 describe('StepTracker status updates', () => {
   // test_start_sets_running
   it('should set status to running on start', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.start('step1');
     expect(tracker.steps[0]?.status).toBe('running');
@@ -73,7 +88,6 @@ describe('StepTracker status updates', () => {
 
   // test_complete_sets_done
   it('should set status to done on complete', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.complete('step1');
     expect(tracker.steps[0]?.status).toBe('done');
@@ -81,7 +95,6 @@ describe('StepTracker status updates', () => {
 
   // test_error_sets_error
   it('should set status to error on error', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.error('step1');
     expect(tracker.steps[0]?.status).toBe('error');
@@ -89,7 +102,6 @@ describe('StepTracker status updates', () => {
 
   // test_skip_sets_skipped
   it('should set status to skipped on skip', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.skip('step1');
     expect(tracker.steps[0]?.status).toBe('skipped');
@@ -97,7 +109,6 @@ describe('StepTracker status updates', () => {
 
   // test_start_with_detail
   it('should set detail when starting', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.start('step1', 'in progress');
     expect(tracker.steps[0]?.detail).toBe('in progress');
@@ -105,7 +116,6 @@ describe('StepTracker status updates', () => {
 
   // test_complete_with_detail
   it('should set detail when completing', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.complete('step1', 'finished successfully');
     expect(tracker.steps[0]?.detail).toBe('finished successfully');
@@ -113,7 +123,6 @@ describe('StepTracker status updates', () => {
 
   // test_update_creates_if_missing
   it('should auto-create step if updating non-existent key', () => {
-    const tracker = new StepTracker('Title');
     tracker.complete('new-step', 'auto created');
     expect(tracker.steps).toHaveLength(1);
     expect(tracker.steps[0]).toEqual({
@@ -123,12 +132,47 @@ describe('StepTracker status updates', () => {
       detail: 'auto created',
     });
   });
+
+  it('should update the matching step among many', () => {
+    for (let i = 0; i < 50; i++) {
+      tracker.add(`step${i}`, `Step ${i}`);
+    }
+    tracker.complete('step42', 'done');
+    tracker.add('step42', 'Duplicate');
+
+    expect(tracker.steps).toHaveLength(50);
+    expect(tracker.steps[42]).toEqual({
+      key: 'step42',
+      label: 'Step 42',
+      status: 'done',
+      detail: 'done',
+    });
+    expect(tracker.steps.filter((s) => s.status === 'done')).toHaveLength(1);
+  });
+
+  // test_tracker_rapid_updates
+  it('should keep one step across rapid updates', () => {
+    const details = Array.from({ length: 100 }, (_, i) => `iteration ${i}`);
+    const callback = vi.fn();
+    tracker.attachRefresh(callback);
+
+    tracker.batch(() => {
+      for (const detail of details) {
+        tracker.start('key', detail);
+      }
+    });
+
+    // One refresh for the whole batch instead of one per update
+    expect(callback).toHaveBeenCalledTimes(1);
+    expect(tracker.steps).toHaveLength(1);
+    expect(tracker.steps[0]?.status).toBe('running');
+    expect(tracker.steps[0]?.detail).toBe('iteration 99');
+  });
 });
 
 describe('StepTracker refresh callback', () => {
   // test_attach_refresh_stores_callback
   it('should store refresh callback', () => {
-    const tracker = new StepTracker('Title');
     const callback = vi.fn();
     tracker.attachRefresh(callback);
     // Verify callback is stored by triggering it
@@ -138,7 +182,6 @@ describe('StepTracker refresh callback', () => {
 
   // test_callback_triggered_on_add
   it('should trigger callback on add', () => {
-    const tracker = new StepTracker('Title');
     const callback = vi.fn();
     tracker.attachRefresh(callback);
     tracker.add('step1', 'Step');
@@ -147,7 +190,6 @@ describe('StepTracker refresh callback', () => {
 
   // test_callback_triggered_on_status_change
   it('should trigger callback on status change', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step');
     const callback = vi.fn();
     tracker.attachRefresh(callback);
@@ -157,36 +199,49 @@ describe('StepTracker refresh callback', () => {
     expect(callback).toHaveBeenCalledTimes(2);
   });
 
+  it('should not refresh after a batch that changed nothing', () => {
+    const callback = vi.fn();
+    tracker.attachRefresh(callback);
+    tracker.batch(() => {});
+    expect(callback).not.toHaveBeenCalled();
+  });
+
+  it('should refresh once after nested batches', () => {
+    const callback = vi.fn();
+    tracker.attachRefresh(callback);
+    tracker.batch(() => {
+      tracker.add('step1', 'Step');
+      tracker.batch(() => tracker.start('step1'));
+      expect(callback).not.toHaveBeenCalled();
+    });
+    expect(callback).toHaveBeenCalledTimes(1);
+  });
+
   // test_callback_exception_ignored
   it('should ignore callback exceptions', () => {
-    const tracker = new StepTracker('Title');
-    const callback = vi.fn().mockImplementation(() => {
-      throw new Error('Callback error');
-    });
+    const callback = vi.fn(throwingRefresh);
     tracker.attachRefresh(callback);
     // Should not throw
     expect(() => tracker.add('step1', 'Step')).not.toThrow();
+    expect(callback).toHaveBeenCalledTimes(1);
   });
 });
 
 describe('StepTracker.render', () => {
   // test_render_returns_string
   it('should return a string', () => {
-    const tracker = new StepTracker('Title');
     const output = tracker.render();
     expect(typeof output).toBe('string');
   });
 
   // test_render_includes_title
   it('should include title in output', () => {
-    const tracker = new StepTracker('My Custom Title');
-    const output = tracker.render();
+    const output = new StepTracker('My Custom Title').render();
     expect(output).toContain('My Custom Title');
   });
 
   // test_done_uses_filled_circle
   it('should use filled circle ● for done status', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Done Step');
     tracker.complete('step1');
     const output = tracker.render();
@@ -195,7 +250,6 @@ describe('StepTracker.render', () => {
 
   // test_pending_uses_dim_circle
   it('should use circle ○ for pending status', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Pending Step');
     const output = tracker.render();
     expect(output).toContain('○');
@@ -203,7 +257,6 @@ describe('StepTracker.render', () => {
 
   // test_running_uses_cyan_circle
   it('should use circle ○ for running status', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Running Step');
     tracker.start('step1');
     const output = tracker.render();
@@ -212,7 +265,6 @@ describe('StepTracker.render', () => {
 
   // test_error_uses_red_circle
   it('should use filled circle ● for error status', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Error Step');
     tracker.error('step1');
     const output = tracker.render();
@@ -221,7 +273,6 @@ describe('StepTracker.render', () => {
 
   // test_skipped_uses_yellow_circle
   it('should use circle ○ for skipped status', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Skipped Step');
     tracker.skip('step1');
     const output = tracker.render();
@@ -230,7 +281,6 @@ describe('StepTracker.render', () => {
 
   // test_detail_in_parentheses
   it('should show detail in parentheses', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.complete('step1', 'my detail');
     const output = tracker.render();
@@ -239,7 +289,6 @@ describe('StepTracker.render', () => {
 
   // test_empty_detail_no_parentheses
   it('should not show parentheses when detail is empty', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'Step One');
     tracker.complete('step1');
     const output = tracker.render();
@@ -247,7 +296,6 @@ describe('StepTracker.render', () => {
   });
 
   it('should include step labels in output', () => {
-    const tracker = new StepTracker('Title');
     tracker.add('step1', 'My Step Label');
     const output = tracker.render();
     expect(output).toContain('My Step Label');
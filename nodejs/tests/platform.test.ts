@@ -3,107 +3,66 @@
  * Ported from Python test_platform_compat.py
  */
 
-import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
-import { platform } from 'os';
-
-// Mock the os module
-vi.mock('os', async () => {
-  const actual = await vi.importActual<typeof import('os')>('os');
-  return {
-    ...actual,
-    platform: vi.fn(() => actual.platform()),
-  };
+import { describe, it, expect, vi } from 'vitest';
+import { homedir } from 'os';
+import { isWindows } from '../src/lib/template/permissions.js';
+import { getGitHubToken } from '../src/lib/github/token.js';
+
+describe('Platform isWindows Detection', () => {
+  it('should detect Windows correctly', () => {
+    if (process.platform === 'win32') {
+      expect(isWindows()).toBe(true);
+    } else {
+      expect(isWindows()).toBe(false);
+    }
+  });
 });
 
-describe('Platform Compatibility', () => {
-  const originalPlatform = process.platform;
+describe('Platform Command Detection', () => {
+  it.todo('should use where on Windows for tool detection');
+  it.todo('should use which on Unix for tool detection');
+});
 
-  afterEach(() => {
-    vi.restoreAllMocks();
+describe('Platform Path Separators', () => {
+  it('should handle Windows path separators', () => {
+    const winPath = 'C:\\Users\\test\\project';
+    expect(winPath).toContain('\\');
   });
 
-  describe('isWindows detection', () => {
-    it('should detect Windows correctly', async () => {
-      const { isWindows } = await import('../src/lib/template/permissions.js');
-      
-      if (process.platform === 'win32') {
-        expect(isWindows()).toBe(true);
-      } else {
-        expect(isWindows()).toBe(false);
-      }
-    });
+  it('should handle Unix path separators', () => {
+    const unixPath = '/home/user/project';
+    expect(unixPath).toContain('/');
   });
+});
 
-  describe('Command detection', () => {
-    it('should use where on Windows for tool detection', () => {
-      // On Windows, the checkTool function uses 'where' command
-      // On Unix, it uses 'which' command
-      const isWin = process.platform === 'win32';
-      expect(isWin).toBe(process.platform === 'win32');
-    });
-
-    it('should use which on Unix for tool detection', () => {
-      const isUnix = process.platform !== 'win32';
-      expect(isUnix).toBe(process.platform !== 'win32');
-    });
-  });
+describe('Platform Script Permissions', () => {
+  it.todo('should skip chmod on Windows');
+  it.todo('should set permissions on Unix');
+});
 
-  describe('Path separators', () => {
-    it('should handle Windows path separators', () => {
-      const winPath = 'C:\\Users\\test\\project';
-      expect(winPath).toContain('\\');
-    });
+describe('Environment GitHub Token Detection', () => {
+  it('should check GH_TOKEN environment variable', () => {
+    vi.stubEnv('GH_TOKEN', 'test-gh-token');
+    vi.stubEnv('GITHUB_TOKEN', '');
 
-    it('should handle Unix path separators', () => {
-      const unixPath = '/home/user/project';
-      expect(unixPath).toContain('/');
-    });
+    expect(getGitHubToken()).toBe('test-gh-token');
   });
 
-  describe('Script permissions', () => {
-    it('should skip chmod on Windows', async () => {
-      const { isWindows } = await import('../src/lib/template/permissions.js');
-      
-      // The ensureExecutableScripts function should be a no-op on Windows
-      if (isWindows()) {
-        // On Windows, permissions are not set via chmod
-        expect(true).toBe(true);
-      }
-    });
+  it('should check GITHUB_TOKEN environment variable', () => {
+    vi.stubEnv('GH_TOKEN', '');
+    vi.stubEnv('GITHUB_TOKEN', 'test-github-token');
 
-    it('should set permissions on Unix', async () => {
-      const { isWindows } = await import('../src/lib/template/permissions.js');
-      
-      if (!isWindows()) {
-        // On Unix, we can set execute permissions
-        expect(true).toBe(true);
-      }
-    });
+    expect(getGitHubToken()).toBe('test-github-token');
   });
 });
 
-describe('Environment Variables', () => {
-  describe('GitHub token detection', () => {
-    it('should check GH_TOKEN environment variable', () => {
-      const tokenType = typeof process.env.GH_TOKEN;
-      expect(['string', 'undefined']).toContain(tokenType);
-    });
-
-    it('should check GITHUB_TOKEN environment variable', () => {
-      const tokenType = typeof process.env.GITHUB_TOKEN;
-      expect(['string', 'undefined']).toContain(tokenType);
-    });
-  });
-
-  describe('Home directory', () => {
-    it('should resolve home directory correctly', async () => {
-      const { homedir } = await import('os');
-      const home = homedir();
-      
-      expect(home).toBeTruthy();
-      expect(typeof home).toBe('string');
-      expect(home.length).toBeGreaterThan(0);
-    });
+describe('Environment Home Directory', () => {
+  it('should resolve home directory correctly', () => {
+    const home = homedir();
+    
+    expect(home).toBeTruthy();
+    expect(typeof home).toBe('string');
+    expect(home.length).toBeGreaterThan(0);
   });
 });
 
@@ -0,0 +1,57 @@
+/**
+ * Tests for the CLI command tree.
+ * Tests for src/program.ts
+ */
+
+import { describe, it, expect, beforeAll } from 'vitest';
+import type { Command } from 'commander';
+import { createProgram } from '../src/program.js';
+
+describe('CLI Program', () => {
+  // Built once for the file; these tests only inspect the command tree
+  let program: Command;
+
+  beforeAll(() => {
+    program = createProgram();
+  });
+
+  it('is named speckit', () => {
+    expect(program.name()).toBe('speckit');
+  });
+
+  it.each([
+    'init',
+    'check',
+    'version',
+    'check-prerequisites',
+    'setup-plan',
+    'create-new-feature',
+    'update-agent-context',
+  ])('registers the %s command', (name) => {
+    expect(program.commands.map(cmd => cmd.name())).toContain(name);
+  });
+
+  it('init exposes its options', () => {
+    const init = program.commands.find(cmd => cmd.name() === 'init');
+    const flags = init?.options.map(opt => opt.long);
+
+    expect(flags).toEqual(expect.arrayContaining([
+      '--ai',
+      '--ignore-agent-tools',
+      '--no-git',
+      '--here',
+      '--force',
+      '--skip-tls',
+      '--debug',
+      '--github-token',
+    ]));
+  });
+
+  it('help lists every command', () => {
+    const help = program.helpInformation();
+
+    for (const cmd of program.commands) {
+      expect(help).toContain(cmd.name());
+    }
+  });
+});
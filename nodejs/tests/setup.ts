@@ -3,17 +3,76 @@
  * Provides common utilities and mocks for tests
  */
 
-import { beforeEach, afterEach, vi } from 'vitest';
+import { statSync } from 'fs';
+import { delimiter, join } from 'path';
+import { vi } from 'vitest';
+import { AGENT_CONFIG } from '../src/lib/config.js';
 
-// Clear all mocks before each test
-beforeEach(() => {
-  vi.clearAllMocks();
-});
+/**
+ * Whether the suite is running on Windows. Computed once so OS-specific tests
+ * can use it.runIf / it.skipIf instead of branching inside each test body.
+ */
+export const IS_WINDOWS = process.platform === 'win32';
+
+/**
+ * AGENT_CONFIG keys partitioned by whether the agent needs a CLI tool.
+ * Built once so tests can check membership without re-filtering the config.
+ */
+export const AGENT_PARTITION: {
+  cli: ReadonlySet<string>;
+  ide: ReadonlySet<string>;
+  all: ReadonlySet<string>;
+} = {
+  cli: new Set(Object.keys(AGENT_CONFIG).filter(key => AGENT_CONFIG[key]?.requiresCli)),
+  ide: new Set(Object.keys(AGENT_CONFIG).filter(key => !AGENT_CONFIG[key]?.requiresCli)),
+  all: new Set(Object.keys(AGENT_CONFIG)),
+};
+
+/**
+ * Whether tests that talk to the real GitHub API should run.
+ * Opt in with SPECKIT_TEST_NETWORK=1; gate such tests with describe.runIf.
+ */
+export const RUN_NETWORK_TESTS = process.env.SPECKIT_TEST_NETWORK === '1';
+
+let gitAvailable: boolean | undefined;
+
+/**
+ * Whether path is a regular file (a directory named git doesn't count)
+ */
+function isFile(path: string): boolean {
+  try {
+    return statSync(path).isFile();
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Whether a git executable is on PATH. Looked up on first call like `which`,
+ * without spawning git, and cached; gate with describe.runIf(gitOnPath()).
+ * Unlike hasGit() in src/lib/common.ts, this says nothing about the cwd.
+ */
+export function gitOnPath(): boolean {
+  if (gitAvailable === undefined) {
+    const names = IS_WINDOWS
+      ? (process.env.PATHEXT ?? '.EXE;.CMD;.BAT').split(';').map(ext => `git${ext.toLowerCase()}`)
+      : ['git'];
+    gitAvailable = (process.env.PATH ?? '')
+      .split(delimiter)
+      .filter(Boolean)
+      .some(dir => names.some(name => isFile(join(dir, name))));
+  }
+  return gitAvailable;
+}
 
-// Restore all mocks after each test
-afterEach(() => {
-  vi.restoreAllMocks();
-});
+/**
+ * Block real network access unless network tests were requested. Tests that
+ * exercise GitHub calls install their own fetch mock (see tests/lib/github/client.test.ts).
+ */
+if (!RUN_NETWORK_TESTS) {
+  globalThis.fetch = ((input: string | URL | Request) =>
+    Promise.reject(new Error(`Unexpected network request in tests: ${String(input)}`))) as typeof fetch;
+}
 
 /**
  * Helper to capture stdout output during a test
@@ -56,37 +115,11 @@ export function captureStderr(): { getOutput: () => string; restore: () => void
 }
 
 /**
- * Helper to set environment variables for a test and restore them after
- */
-export function mockEnv(vars: Record<string, string | undefined>): () => void {
-  const originalEnv: Record<string, string | undefined> = {};
-
-  for (const key of Object.keys(vars)) {
-    originalEnv[key] = process.env[key];
-    if (vars[key] === undefined) {
-      delete process.env[key];
-    } else {
-      process.env[key] = vars[key];
-    }
-  }
-
-  return () => {
-    for (const key of Object.keys(vars)) {
-      if (originalEnv[key] === undefined) {
-        delete process.env[key];
-      } else {
-        process.env[key] = originalEnv[key];
-      }
-    }
-  };
-}
-
-/**
- * Helper to clear all environment variables related to GitHub tokens
+ * Helper to clear all environment variables related to GitHub tokens.
+ * Stubs only the two token keys; vitest (unstubEnvs) restores them after
+ * the test, and an empty value counts as unset for getGitHubToken.
  */
-export function clearEnv(): () => void {
-  return mockEnv({
-    GH_TOKEN: undefined,
-    GITHUB_TOKEN: undefined,
-  });
+export function clearEnv(): void {
+  vi.stubEnv('GH_TOKEN', '');
+  vi.stubEnv('GITHUB_TOKEN', '');
 }
@@ -12,5 +12,12 @@ export default defineConfig({
       exclude: ['src/types/**', 'src/**/*.d.ts'],
     },
     setupFiles: ['tests/setup.ts'],
+    clearMocks: true,
+    restoreMocks: true,
+    // Roll back vi.stubEnv calls after each test
+    unstubEnvs: true,
+    // Test files are quick, so failed/slow-first ordering from the results cache
+    // gains little; skip writing it after every run
+    cache: false,
   },
 });